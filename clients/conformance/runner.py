@@ -12,16 +12,24 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import functools
 import http.server
 import json
 import os
+import select
 import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    _json_loads = json.loads
 
 # ---------------------------------------------------------------------------
 # Fixture server
@@ -65,19 +73,32 @@ FIXTURE_HTML = {
 
 class FixtureHandler(http.server.BaseHTTPRequestHandler):
     port: int = 0
+    # Encoded response bodies and content types, filled in by prepare().
+    bodies: dict[str, bytes] = {}
+    content_types: dict[str, str] = {}
+
+    @classmethod
+    def prepare(cls, port: int) -> None:
+        """Substitute the server port and encode every fixture once."""
+        cls.port = port
+        port_str = str(port)
+        cls.bodies = {
+            path: html.replace("{{PORT}}", port_str).encode()
+            for path, html in FIXTURE_HTML.items()
+        }
+        cls.content_types = {
+            path: "application/xml" if path.endswith(".xml") else "text/html"
+            for path in FIXTURE_HTML
+        }
 
     def do_GET(self) -> None:
-        content = FIXTURE_HTML.get(self.path)
-        if content:
-            body = content.replace("{{PORT}}", str(self.port))
+        body = self.bodies.get(self.path)
+        if body:
             self.send_response(200)
-            if self.path.endswith(".xml"):
-                self.send_header("Content-Type", "application/xml")
-            else:
-                self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Type", self.content_types[self.path])
             self.send_header("Content-Length", str(len(body)))
             self.end_headers()
-            self.wfile.write(body.encode())
+            self.wfile.write(body)
         else:
             self.send_response(404)
             self.end_headers()
@@ -91,14 +112,14 @@ class FixtureHandler(http.server.BaseHTTPRequestHandler):
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class TestResult:
     case_id: str
     passed: bool
     message: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SuiteResult:
     suite: str
     client: str
@@ -113,54 +134,98 @@ class SuiteResult:
         return sum(1 for r in self.results if not r.passed)
 
 
+_OPS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda v, e: v == e,
+    "gte": lambda v, e: v is not None and v >= e,
+    "lte": lambda v, e: v is not None and v <= e,
+    "in": lambda v, e: v in e,
+    "all_eq": lambda v, e: isinstance(v, list) and all(x == e for x in v),
+}
+
+
 def check_assertion(
     value: Any, assertion: dict[str, Any]
 ) -> tuple[bool, str]:
-    """Evaluate a single assertion against a value."""
-    op = assertion["op"]
-    expected = assertion["value"]
+    """Evaluate a single assertion against a value.
+
+    Uses the ``_op``/``_skip_null`` fields precomputed by :func:`_prepare_case`
+    when present.
+    """
+    if "_op" in assertion:
+        fn = assertion["_op"]
+        skip_null = assertion["_skip_null"]
+    else:
+        fn = _OPS.get(assertion["op"])
+        skip_null = bool(assertion.get("if_not_null"))
 
-    if assertion.get("if_not_null") and value is None:
+    if skip_null and value is None:
         return True, "skipped (null)"
+    if fn is None:
+        return False, f"unknown op: {assertion['op']}"
 
-    if op == "eq":
-        ok = value == expected
-    elif op == "gte":
-        ok = value is not None and value >= expected
-    elif op == "lte":
-        ok = value is not None and value <= expected
-    elif op == "in":
-        ok = value in expected
-    elif op == "all_eq":
-        ok = isinstance(value, list) and all(v == expected for v in value)
-    else:
-        return False, f"unknown op: {op}"
-
-    if ok:
+    expected = assertion["value"]
+    if fn(value, expected):
         return True, ""
-    return False, f"expected {op} {expected}, got {value}"
+    return False, f"expected {assertion['op']} {expected}, got {value}"
 
 
-def extract_field(data: Any, field_path: str) -> Any:
-    """Extract a field from response data using a simple path expression."""
+def _compile_path(field_path: str) -> tuple[str, Any]:
+    """Parse a field path expression into a ``(kind, arg)`` pair once."""
     if field_path == "length":
-        return len(data) if isinstance(data, list) else 0
+        return ("len", None)
     if field_path == "result_type":
-        return "null" if data is None else "path"
+        return ("rtype", None)
     if field_path.startswith("[*]."):
-        attr = field_path[4:]
-        if isinstance(data, list):
-            return [item.get(attr) if isinstance(item, dict) else getattr(item, attr, None) for item in data]
-        return []
+        return ("star", field_path[4:])
     if field_path.startswith("nodes["):
-        idx = int(field_path.split("[")[1].split("]")[0])
-        if isinstance(data, dict) and "nodes" in data:
-            nodes = data["nodes"]
-            return nodes[idx] if idx < len(nodes) else None
-        return None
+        return ("nodes_idx", int(field_path.split("[")[1].split("]")[0]))
+    return ("key", field_path)
+
+
+def _extract_len(data: Any, _: Any) -> Any:
+    return len(data) if isinstance(data, list) else 0
+
+
+def _extract_rtype(data: Any, _: Any) -> Any:
+    return "null" if data is None else "path"
+
+
+def _extract_star(data: Any, attr: str) -> Any:
+    if isinstance(data, list):
+        return [item.get(attr) if isinstance(item, dict) else getattr(item, attr, None) for item in data]
+    return []
+
+
+def _extract_nodes_idx(data: Any, idx: int) -> Any:
+    if isinstance(data, dict) and "nodes" in data:
+        nodes = data["nodes"]
+        return nodes[idx] if idx < len(nodes) else None
+    return None
+
+
+def _extract_key(data: Any, key: str) -> Any:
     if isinstance(data, dict):
-        return data.get(field_path)
-    return getattr(data, field_path, None)
+        return data.get(key)
+    return getattr(data, key, None)
+
+
+_DISPATCH: dict[str, Callable[[Any, Any], Any]] = {
+    "len": _extract_len,
+    "rtype": _extract_rtype,
+    "star": _extract_star,
+    "nodes_idx": _extract_nodes_idx,
+    "key": _extract_key,
+}
+
+
+def extract_field(data: Any, field_path: str | tuple[str, Any]) -> Any:
+    """Extract a field from response data using a simple path expression.
+
+    ``field_path`` is either the raw expression or its precompiled form from
+    :func:`_compile_path`.
+    """
+    kind, arg = _compile_path(field_path) if isinstance(field_path, str) else field_path
+    return _DISPATCH[kind](data, arg)
 
 
 # ---------------------------------------------------------------------------
@@ -169,9 +234,13 @@ def extract_field(data: Any, field_path: str) -> Any:
 
 
 def run_python_case(
-    case: dict[str, Any], port: int
+    case: dict[str, Any], port: int, conn: Any = None
 ) -> TestResult:
-    """Execute a single test case using the Python client."""
+    """Execute a single test case using the Python client.
+
+    ``conn`` is an optional open ``cortex_client.Connection`` shared by every
+    case, so the runner does not open a new socket per map call.
+    """
     try:
         import cortex_client
 
@@ -188,6 +257,7 @@ def run_python_case(
                 max_nodes=args.get("max_nodes", 50000),
                 max_render=args.get("max_render", 200),
                 max_time_ms=args.get("max_time_ms", 10000),
+                conn=conn,
             )
             data: Any = {
                 "node_count": result.node_count,
@@ -195,7 +265,9 @@ def run_python_case(
                 "domain": result.domain,
             }
         elif method == "query":
-            sm = cortex_client.map(args["domain"], max_render=5)
+            sm = cortex_client.map(
+                args["domain"], max_render=5, cache=True, conn=conn
+            )
             matches = sm.filter(
                 page_type=args.get("page_type"),
                 limit=args.get("limit", 100),
@@ -205,7 +277,9 @@ def run_python_case(
                 for m in matches
             ]
         elif method == "pathfind":
-            sm = cortex_client.map(args["domain"], max_render=5)
+            sm = cortex_client.map(
+                args["domain"], max_render=5, cache=True, conn=conn
+            )
             path = sm.pathfind(
                 args["from_node"],
                 args["to_node"],
@@ -224,7 +298,7 @@ def run_python_case(
 
         for assertion in case.get("assertions", []):
             field_path = assertion["field"]
-            value = extract_field(data, field_path)
+            value = extract_field(data, assertion.get("_path", field_path))
             ok, msg = check_assertion(value, assertion)
             if not ok:
                 return TestResult(
@@ -242,31 +316,79 @@ def run_python_case(
 # ---------------------------------------------------------------------------
 
 
-def run_typescript_case(
-    case: dict[str, Any], port: int
-) -> TestResult:
-    """Execute a single test case via TypeScript subprocess."""
-    try:
-        action = case["action"]
-        script = _build_ts_script(action, port)
-        ts_dir = Path(__file__).parent.parent / "typescript"
+class TsDriver:
+    """A persistent ``node ts_driver.js`` process shared by TypeScript cases.
 
-        proc = subprocess.run(
-            ["node", "-e", script],
+    Requests and responses are single JSON lines; a lock keeps one request in
+    flight at a time. The process is (re)started on demand.
+    """
+
+    def __init__(self) -> None:
+        self._proc: subprocess.Popen[str] | None = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> subprocess.Popen[str]:
+        ts_dir = Path(__file__).parent.parent / "typescript"
+        self._proc = subprocess.Popen(
+            ["node", str(Path(__file__).parent / "ts_driver.js")],
             cwd=str(ts_dir),
-            capture_output=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            # Inherited, so driver warnings show up and can never fill a pipe.
+            stderr=None,
             text=True,
-            timeout=30,
+            bufsize=1,
         )
+        return self._proc
+
+    def call(
+        self, method: str, args: dict[str, Any], timeout: float = 30.0
+    ) -> dict[str, Any]:
+        """Send one request and wait for its response line.
+
+        Raises:
+            subprocess.TimeoutExpired: If no response arrives within ``timeout``.
+            RuntimeError: If the Node process exits.
+        """
+        with self._lock:
+            proc = self._proc
+            if proc is None or proc.poll() is not None:
+                proc = self._start()
+            assert proc.stdin is not None and proc.stdout is not None
+            proc.stdin.write(json.dumps({"method": method, "args": args}) + "\n")
+            proc.stdin.flush()
+            ready, _, _ = select.select([proc.stdout], [], [], timeout)
+            if not ready:
+                self.close()
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+            line = proc.stdout.readline()
+            if not line:
+                self.close()
+                raise RuntimeError("ts_driver.js exited (see its stderr above)")
+            resp: dict[str, Any] = json.loads(line)
+            return resp
+
+    def close(self) -> None:
+        """Stop the Node process."""
+        if self._proc is not None:
+            self._proc.kill()
+            self._proc.wait()
+            self._proc = None
+
+
+def run_typescript_case(case: dict[str, Any], driver: TsDriver) -> TestResult:
+    """Execute a single test case via the persistent TypeScript driver."""
+    try:
+        action = case["action"]
+        resp = driver.call(action["method"], action["args"])
+        if not resp["ok"]:
+            return TestResult(case["id"], False, f"node error: {resp['error']}")
 
-        if proc.returncode != 0:
-            return TestResult(case["id"], False, f"node error: {proc.stderr.strip()}")
-
-        data = json.loads(proc.stdout.strip()) if proc.stdout.strip() else None
+        data = resp["data"]
 
         for assertion in case.get("assertions", []):
             field_path = assertion["field"]
-            value = extract_field(data, field_path)
+            value = extract_field(data, assertion.get("_path", field_path))
             ok, msg = check_assertion(value, assertion)
             if not ok:
                 return TestResult(
@@ -277,103 +399,140 @@ def run_typescript_case(
 
     except subprocess.TimeoutExpired:
         return TestResult(case["id"], False, "timeout")
+    except RuntimeError as e:
+        return TestResult(case["id"], False, f"node error: {e}")
     except Exception as e:
         return TestResult(case["id"], False, f"exception: {e}")
 
 
-def _build_ts_script(action: dict[str, Any], port: int) -> str:
-    """Build a Node.js script that calls the TS client and prints JSON."""
-    method = action["method"]
-    args = action["args"]
-    domain = args.get("domain", "").replace("{{PORT}}", str(port))
-
-    if method == "map":
-        return f"""
-const {{ map }} = require('./dist/index');
-(async () => {{
-  const sm = await map('{domain}', {{
-    maxNodes: {args.get('max_nodes', 50000)},
-    maxRender: {args.get('max_render', 200)},
-    maxTimeMs: {args.get('max_time_ms', 10000)},
-  }});
-  console.log(JSON.stringify({{
-    node_count: sm.nodeCount,
-    edge_count: sm.edgeCount,
-    domain: sm.domain,
-  }}));
-}})().catch(e => {{ console.error(e.message); process.exit(1); }});
-"""
-    elif method == "query":
-        pt = args.get("page_type", "undefined")
-        return f"""
-const {{ map }} = require('./dist/index');
-(async () => {{
-  const sm = await map('{domain}', {{ maxRender: 5 }});
-  const matches = await sm.filter({{
-    pageType: {pt},
-    limit: {args.get('limit', 100)},
-  }});
-  console.log(JSON.stringify(matches.map(m => ({{
-    index: m.index, url: m.url, page_type: m.pageType,
-  }}))));
-}})().catch(e => {{ console.error(e.message); process.exit(1); }});
-"""
-    elif method == "pathfind":
-        return f"""
-const {{ map }} = require('./dist/index');
-(async () => {{
-  const sm = await map('{domain}', {{ maxRender: 5 }});
-  const path = await sm.pathfind({args['from_node']}, {args['to_node']}, {{
-    minimize: '{args.get('minimize', 'hops')}',
-  }});
-  if (path === null) {{
-    console.log('null');
-  }} else {{
-    console.log(JSON.stringify({{
-      nodes: path.nodes,
-      hops: path.hops,
-      total_weight: path.totalWeight,
-    }}));
-  }}
-}})().catch(e => {{ console.error(e.message); process.exit(1); }});
-"""
-    return 'console.error("unknown method"); process.exit(1);'
-
-
 # ---------------------------------------------------------------------------
 # Main runner
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
 def load_suite(name: str) -> dict[str, Any]:
-    """Load a test suite JSON file."""
+    """Load a test suite JSON file (once per name; treat the result as read-only)."""
     suite_path = Path(__file__).parent / f"test_{name}.json"
-    with open(suite_path) as f:
-        return json.load(f)
+    return _json_loads(suite_path.read_bytes())
+
+
+def _subst(obj: Any, port_str: str) -> Any:
+    """Return a copy of ``obj`` with ``{{PORT}}`` replaced in every string."""
+    if isinstance(obj, str):
+        return obj.replace("{{PORT}}", port_str)
+    if isinstance(obj, list):
+        return [_subst(x, port_str) for x in obj]
+    if isinstance(obj, dict):
+        return {k: _subst(v, port_str) for k, v in obj.items()}
+    return obj
+
+
+# Port-substituted case lists, keyed by (suite name, fixture port).
+_subst_cache: dict[tuple[str, int], list[dict[str, Any]]] = {}
+
+
+def _suite_cases(suite_data: dict[str, Any], port: int) -> list[dict[str, Any]]:
+    """Return the suite's prepared cases with ``{{PORT}}`` substituted, computed once."""
+    key = (suite_data["suite"], port)
+    cases = _subst_cache.get(key)
+    if cases is None:
+        port_str = str(port)
+        cases = [_prepare_case(_subst(case, port_str)) for case in suite_data["cases"]]
+        _subst_cache[key] = cases
+    return cases
+
+
+def _prepare_case(case: dict[str, Any]) -> dict[str, Any]:
+    """Precompile each assertion's field path and op (stored as ``_path``,
+    ``_op`` and ``_skip_null``)."""
+    for assertion in case.get("assertions", []):
+        assertion["_path"] = _compile_path(assertion["field"])
+        assertion["_op"] = _OPS.get(assertion["op"])
+        assertion["_skip_null"] = bool(assertion.get("if_not_null"))
+    return case
 
 
 def run_suite(
     suite_data: dict[str, Any],
     client: str,
     port: int,
+    conn: Any = None,
+    ts_driver: TsDriver | None = None,
 ) -> SuiteResult:
     """Run all cases in a suite for a specific client."""
     suite_name = suite_data["suite"]
     result = SuiteResult(suite=suite_name, client=client)
 
-    for case in suite_data["cases"]:
-        case_text = json.dumps(case)
-        case = json.loads(case_text.replace("{{PORT}}", str(port)))
+    own_driver = client != "python" and ts_driver is None
+    if own_driver:
+        ts_driver = TsDriver()
 
+    for case in _suite_cases(suite_data, port):
         if client == "python":
-            tr = run_python_case(case, port)
+            tr = run_python_case(case, port, conn)
         else:
-            tr = run_typescript_case(case, port)
+            assert ts_driver is not None
+            tr = run_typescript_case(case, ts_driver)
         result.results.append(tr)
 
+    if own_driver:
+        assert ts_driver is not None
+        ts_driver.close()
     return result
 
 
+def _print_suite(sr: SuiteResult) -> None:
+    print(f"\n--- {sr.suite} / {sr.client} ---")
+    for tr in sr.results:
+        status = "PASS" if tr.passed else "FAIL"
+        msg = f"  {status}: {tr.case_id}"
+        if tr.message:
+            msg += f" ({tr.message})"
+        print(msg)
+
+
+def _run_client(
+    client: str,
+    suite_names: list[str],
+    port: int,
+    conn: Any,
+    ts_driver: TsDriver | None,
+    print_lock: threading.Lock,
+) -> list[SuiteResult]:
+    """Run every suite for one client, printing each as it finishes.
+
+    Suites for one client stay sequential: they share that client's
+    connection (or driver process) and its map cache.
+    """
+    results: list[SuiteResult] = []
+    for suite_name in suite_names:
+        sr = run_suite(load_suite(suite_name), client, port, conn, ts_driver)
+        with print_lock:
+            _print_suite(sr)
+        results.append(sr)
+    return results
+
+
+def _open_python_connection() -> Any:
+    """Start Cortex if needed and open one connection for all Python cases.
+
+    Returns None if the Python client is unavailable; cases then report the
+    underlying error themselves.
+    """
+    try:
+        import cortex_client
+        from cortex_client.autostart import ensure_running
+
+        ensure_running()
+        conn = cortex_client.Connection()
+        conn.connect()
+        return conn
+    except Exception as e:
+        print(f"warning: no shared Python connection ({e})", file=sys.stderr)
+        return None
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Cortex conformance test runner")
     parser.add_argument(
@@ -390,9 +549,11 @@ def main() -> int:
     args = parser.parse_args()
 
     # Start fixture server
-    server = http.server.HTTPServer(("127.0.0.1", args.port), FixtureHandler)
+    # Threaded so concurrent crawls (e.g. --client both) are not serialized
+    # behind one handler; ThreadingHTTPServer uses daemon worker threads.
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", args.port), FixtureHandler)
     port = server.server_address[1]
-    FixtureHandler.port = port
+    FixtureHandler.prepare(port)
     thread = threading.Thread(target=server.serve_forever, daemon=True)
     thread.start()
     print(f"Fixture server on port {port}")
@@ -401,19 +562,26 @@ def main() -> int:
     suite_names = ["map", "query", "pathfind"] if args.suite == "all" else [args.suite]
     clients = ["python", "typescript"] if args.client == "both" else [args.client]
 
-    all_results: list[SuiteResult] = []
-    for suite_name in suite_names:
-        suite_data = load_suite(suite_name)
-        for client in clients:
-            print(f"\n--- {suite_name} / {client} ---")
-            sr = run_suite(suite_data, client, port)
-            all_results.append(sr)
-            for tr in sr.results:
-                status = "PASS" if tr.passed else "FAIL"
-                msg = f"  {status}: {tr.case_id}"
-                if tr.message:
-                    msg += f" ({tr.message})"
-                print(msg)
+    conn = _open_python_connection() if "python" in clients else None
+    ts_driver = TsDriver() if "typescript" in clients else None
+
+    # Clients are independent, so run them side by side; the wall time is
+    # then that of the slower client rather than the sum of both.
+    print_lock = threading.Lock()
+    with ThreadPoolExecutor(max_workers=len(clients)) as pool:
+        futures = [
+            pool.submit(
+                _run_client,
+                client,
+                suite_names,
+                port,
+                conn if client == "python" else None,
+                ts_driver,
+                print_lock,
+            )
+            for client in clients
+        ]
+        all_results = [sr for f in futures for sr in f.result()]
 
     # Summary
     total_pass = sum(sr.passed for sr in all_results)
@@ -421,6 +589,10 @@ def main() -> int:
     print(f"\n{'='*40}")
     print(f"Total: {total_pass} passed, {total_fail} failed")
 
+    if conn is not None:
+        conn.close()
+    if ts_driver is not None:
+        ts_driver.close()
     server.shutdown()
     return 1 if total_fail > 0 else 0
 
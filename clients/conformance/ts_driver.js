@@ -0,0 +1,78 @@
+#!/usr/bin/env node
+// Copyright 2026 Cortex Contributors
+// SPDX-License-Identifier: Apache-2.0
+//
+// Persistent conformance driver for the TypeScript client.
+//
+// Reads one JSON request per line on stdin, {"method": ..., "args": {...}},
+// and writes one JSON response per line on stdout, either
+// {"ok": true, "data": ...} or {"ok": false, "error": "..."}. Requests are
+// handled strictly in order. runner.py starts this once per run, so Node
+// startup and client loading are paid once instead of per test case.
+"use strict";
+
+const path = require("path");
+const readline = require("readline");
+
+const { map } = require(path.join(__dirname, "..", "typescript", "dist", "index"));
+
+// Each handler gets `open`, which maps a domain and registers the SiteMap so
+// its socket is closed once the request finishes, whether or not it failed.
+const handlers = {
+  async map(args, open) {
+    const sm = await open(args.domain, {
+      maxNodes: args.max_nodes ?? 50000,
+      maxRender: args.max_render ?? 200,
+      maxTimeMs: args.max_time_ms ?? 10000,
+    });
+    return { node_count: sm.nodeCount, edge_count: sm.edgeCount, domain: sm.domain };
+  },
+
+  async query(args, open) {
+    const sm = await open(args.domain, { maxRender: 5 });
+    const matches = await sm.filter({
+      pageType: args.page_type,
+      limit: args.limit ?? 100,
+    });
+    return matches.map((m) => ({ index: m.index, url: m.url, page_type: m.pageType }));
+  },
+
+  async pathfind(args, open) {
+    const sm = await open(args.domain, { maxRender: 5 });
+    const p = await sm.pathfind(args.from_node, args.to_node, {
+      minimize: args.minimize ?? "hops",
+    });
+    return p === null ? null : { nodes: p.nodes, hops: p.hops, total_weight: p.totalWeight };
+  },
+};
+
+async function handle(line) {
+  // Each case maps afresh; release its sockets since the process lives on.
+  const opened = [];
+  const open = async (domain, opts) => {
+    const sm = await map(domain, opts);
+    opened.push(sm);
+    return sm;
+  };
+  try {
+    const { method, args } = JSON.parse(line);
+    const handler = handlers[method];
+    if (!handler) {
+      return { ok: false, error: `unknown method: ${method}` };
+    }
+    return { ok: true, data: await handler(args, open) };
+  } catch (e) {
+    return { ok: false, error: e.message };
+  } finally {
+    for (const sm of opened) {
+      sm.conn.close();
+    }
+  }
+}
+
+let pending = Promise.resolve();
+readline.createInterface({ input: process.stdin }).on("line", (line) => {
+  pending = pending
+    .then(() => handle(line))
+    .then((out) => process.stdout.write(JSON.stringify(out) + "\n"));
+});
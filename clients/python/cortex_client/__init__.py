@@ -13,11 +13,24 @@ Quick start::
 
 from __future__ import annotations
 
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from typing import Any, Callable, TypeVar
 from urllib.parse import urlparse
 
+from .aconnection import AsyncConnection
 from .autostart import ensure_running
-from .connection import Connection, DEFAULT_SOCKET_PATH
+from .connection import (
+    Connection,
+    DEFAULT_SOCKET_PATH,
+    DEFAULT_TIMEOUT,
+    json_dumps,
+    json_loads,
+)
 from .errors import (
     CortexActError,
     CortexConnectionError,
@@ -31,7 +44,9 @@ from .errors import (
 from .session import Session
 from .sitemap import (
     ActResult,
+    AsyncSiteMap,
     NodeMatch,
+    NodeMatchBatch,
     Path,
     PathAction,
     RefreshResult,
@@ -40,7 +55,21 @@ from .sitemap import (
 )
 from . import protocol
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
+
+_T = TypeVar("_T")
+
+# Opt-in result caches for map(cache=True) and status(cache=True).
+_MAP_CACHE_TTL = 60.0
+_MAP_CACHE_MAX = 128
+_STATUS_CACHE_TTL = 1.0
+_map_cache: OrderedDict[tuple[Any, ...], tuple[float, SiteMap]] = OrderedDict()
+_status_cache: dict[str, tuple[float, RuntimeStatus]] = {}
+_cache_lock = threading.Lock()
+
+# How long a successful ensure_running() check is trusted per socket path.
+_ALIVE_TTL = 5.0
+_alive_until: dict[str, float] = {}
 
 __all__ = [
     # Top-level functions
@@ -51,14 +80,23 @@ __all__ = [
     "act",
     "compare",
     "status",
+    "amap",
+    "amap_many",
+    "aperceive",
+    "aperceive_many",
+    "astatus",
     "login",
     "login_oauth",
     "login_api_key",
     # Utilities
     "normalize_domain",
+    "json_dumps",
+    "json_loads",
     # Classes
     "SiteMap",
+    "AsyncSiteMap",
     "NodeMatch",
+    "NodeMatchBatch",
     "Path",
     "PathAction",
     "RefreshResult",
@@ -68,6 +106,7 @@ __all__ = [
     "PageResult",
     "Session",
     "Connection",
+    "AsyncConnection",
     # Errors
     "CortexError",
     "CortexConnectionError",
@@ -122,7 +161,7 @@ def normalize_domain(domain: str) -> str:
     return d
 
 
-@dataclass
+@dataclass(slots=True)
 class RuntimeStatus:
     """Status of the Cortex runtime.
 
@@ -147,7 +186,7 @@ class RuntimeStatus:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PageResult:
     """Result of perceiving a single page.
 
@@ -175,6 +214,58 @@ class PageResult:
         )
 
 
+def _ensure(socket_path: str) -> None:
+    """Call :func:`ensure_running` unless it succeeded in the last few seconds."""
+    now = time.monotonic()
+    if _alive_until.get(socket_path, 0.0) > now:
+        return
+    ensure_running(socket_path)
+    _alive_until[socket_path] = now + _ALIVE_TTL
+
+
+async def _aensure(socket_path: str) -> None:
+    """Asyncio variant of :func:`_ensure`; only hops to a thread on a miss."""
+    if _alive_until.get(socket_path, 0.0) <= time.monotonic():
+        await asyncio.to_thread(_ensure, socket_path)
+
+
+def _pooled_send(
+    socket_path: str,
+    method: str,
+    params: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Send one request over a pooled connection.
+
+    The connection is returned to the pool on success and dropped if the
+    send fails, so a broken socket is never handed to the next caller.
+    """
+    conn = Connection.acquire(socket_path)
+    try:
+        resp = conn.send(method, params)
+    except BaseException as e:
+        conn.close()
+        if isinstance(e, CortexConnectionError):
+            _alive_until.pop(socket_path, None)
+        raise
+    conn.release()
+    return resp
+
+
+async def _asend(
+    socket_path: str,
+    method: str,
+    params: dict[str, Any] | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> dict[str, Any]:
+    """Send one request over a short-lived :class:`AsyncConnection`."""
+    try:
+        async with AsyncConnection(socket_path, timeout=timeout) as aconn:
+            return await aconn.send(method, params)
+    except CortexConnectionError:
+        _alive_until.pop(socket_path, None)
+        raise
+
+
 def map(
     domain: str,
     *,
@@ -185,6 +276,8 @@ def map(
     respect_robots: bool = True,
     socket_path: str = DEFAULT_SOCKET_PATH,
     timeout_ms: int = 30000,
+    cache: bool = False,
+    conn: Connection | None = None,
 ) -> SiteMap:
     """Map a website and return a navigable SiteMap.
 
@@ -201,6 +294,12 @@ def map(
         respect_robots: Whether to respect robots.txt.
         socket_path: Path to the Cortex Unix socket.
         timeout_ms: Client timeout in milliseconds.
+        cache: Reuse the SiteMap from an identical call made within the
+            last 60 seconds instead of mapping again. Cached SiteMaps are
+            shared between callers. Ignored when ``conn`` is given.
+        conn: Existing connection to send the request over. Skips the
+            auto-start check and the cache; the returned SiteMap keeps
+            using ``conn``.
 
     Returns:
         A SiteMap object for querying and navigating.
@@ -221,8 +320,46 @@ def map(
         site = cortex_client.map("example.com", session=session)
     """
     domain = normalize_domain(domain)
-    ensure_running(socket_path)
-    conn = Connection(socket_path, timeout=(timeout_ms / 1000.0) + 15.0)
+    # A cached SiteMap is bound to the connection that fetched it, so a
+    # caller-supplied connection always maps afresh.
+    if cache and conn is None:
+        key = (
+            socket_path,
+            domain,
+            max_nodes,
+            max_render,
+            max_time_ms,
+            respect_robots,
+            session.session_id if session is not None else None,
+        )
+        now = time.monotonic()
+        with _cache_lock:
+            hit = _map_cache.get(key)
+            if hit is not None and hit[0] > now:
+                _map_cache.move_to_end(key)
+                return hit[1]
+        try:
+            site = map(
+                domain,
+                session=session,
+                max_nodes=max_nodes,
+                max_render=max_render,
+                max_time_ms=max_time_ms,
+                respect_robots=respect_robots,
+                socket_path=socket_path,
+                timeout_ms=timeout_ms,
+            )
+        except CortexMapError:
+            with _cache_lock:
+                _map_cache.pop(key, None)
+            raise
+        with _cache_lock:
+            _map_cache[key] = (time.monotonic() + _MAP_CACHE_TTL, site)
+            _map_cache.move_to_end(key)
+            while len(_map_cache) > _MAP_CACHE_MAX:
+                _map_cache.popitem(last=False)
+        return site
+
     params = protocol.map_request(
         domain,
         max_nodes=max_nodes,
@@ -232,14 +369,28 @@ def map(
     )
     if session is not None:
         params["session_id"] = session.session_id
-    resp = conn.send("map", params)
+    if conn is not None:
+        return _site_map(conn, domain, conn.send("map", params))
+
+    _ensure(socket_path)
+    # The returned SiteMap keeps the connection, so it only goes back to the
+    # pool when the map request itself fails.
+    conn = Connection.acquire(socket_path, timeout=(timeout_ms / 1000.0) + 15.0)
+    try:
+        resp = conn.send("map", params)
+    except BaseException as e:
+        conn.close()
+        if isinstance(e, CortexConnectionError):
+            _alive_until.pop(socket_path, None)
+        raise
     if "error" in resp:
-        err = resp["error"]
-        raise CortexMapError(
-            err.get("message", "map failed"),
-            code=err.get("code", "E_MAP_FAILED"),
-        )
-    result = resp.get("result", {})
+        conn.release()
+    return _site_map(conn, domain, resp)
+
+
+def _site_map(conn: Connection, domain: str, resp: dict[str, Any]) -> SiteMap:
+    """Build a SiteMap from a MAP response, raising on error."""
+    result = _map_result(resp)
     return SiteMap(
         conn=conn,
         domain=domain,
@@ -249,6 +400,18 @@ def map(
     )
 
 
+def _map_result(resp: dict[str, Any]) -> dict[str, Any]:
+    """Return the result of a MAP response, raising CortexMapError on error."""
+    if "error" in resp:
+        err = resp["error"]
+        raise CortexMapError(
+            err.get("message", "map failed"),
+            code=err.get("code", "E_MAP_FAILED"),
+        )
+    result: dict[str, Any] = resp.get("result", {})
+    return result
+
+
 def map_many(
     domains: list[str],
     *,
@@ -257,8 +420,11 @@ def map_many(
     max_time_ms: int = 10000,
     respect_robots: bool = True,
     socket_path: str = DEFAULT_SOCKET_PATH,
+    max_workers: int | None = None,
 ) -> list[SiteMap]:
-    """Map multiple websites.
+    """Map multiple websites concurrently.
+
+    Each domain is mapped on a worker thread with its own connection.
 
     Args:
         domains: List of domains to map. Each is normalized automatically.
@@ -267,25 +433,28 @@ def map_many(
         max_time_ms: Maximum mapping time per domain.
         respect_robots: Whether to respect robots.txt.
         socket_path: Path to the Cortex Unix socket.
+        max_workers: Maximum concurrent requests. Defaults to one per
+            domain, capped at 32.
 
     Returns:
-        List of SiteMap objects.
+        List of SiteMap objects, in the same order as ``domains``.
 
     Example::
 
         sites = cortex_client.map_many(["amazon.com", "bestbuy.com"])
     """
-    return [
-        map(
+    return _run_many(
+        lambda d: map(
             d,
             max_nodes=max_nodes,
             max_render=max_render,
             max_time_ms=max_time_ms,
             respect_robots=respect_robots,
             socket_path=socket_path,
-        )
-        for d in domains
-    ]
+        ),
+        domains,
+        max_workers,
+    )
 
 
 def perceive(
@@ -309,10 +478,14 @@ def perceive(
         page = cortex_client.perceive("https://amazon.com/dp/B0EXAMPLE")
         print(f"Page type: {page.page_type}, confidence: {page.confidence}")
     """
-    ensure_running(socket_path)
-    conn = Connection(socket_path)
+    _ensure(socket_path)
     params = protocol.perceive_request(url, include_content=include_content)
-    resp = conn.send("perceive", params)
+    resp = _pooled_send(socket_path, "perceive", params)
+    return _page_result(url, resp)
+
+
+def _page_result(url: str, resp: dict[str, Any]) -> PageResult:
+    """Build a PageResult from a PERCEIVE response, raising on error."""
     if "error" in resp:
         err = resp["error"]
         raise CortexResourceError(
@@ -335,31 +508,53 @@ def perceive_many(
     *,
     include_content: bool = True,
     socket_path: str = DEFAULT_SOCKET_PATH,
+    max_workers: int | None = None,
 ) -> list[PageResult]:
-    """Perceive multiple pages.
+    """Perceive multiple pages concurrently.
 
     Args:
         urls: List of URLs to perceive.
         include_content: Whether to include raw text content.
         socket_path: Path to the Cortex Unix socket.
+        max_workers: Maximum concurrent requests. Defaults to one per URL,
+            capped at 32.
 
     Returns:
-        List of PageResult objects.
+        List of PageResult objects, in the same order as ``urls``.
     """
-    return [
-        perceive(u, include_content=include_content, socket_path=socket_path)
-        for u in urls
-    ]
+    return _run_many(
+        lambda u: perceive(
+            u, include_content=include_content, socket_path=socket_path
+        ),
+        urls,
+        max_workers,
+    )
+
+
+def _run_many(
+    fn: Callable[[str], _T],
+    items: list[str],
+    max_workers: int | None,
+) -> list[_T]:
+    """Apply ``fn`` to every item on a thread pool, preserving input order."""
+    if not items:
+        return []
+    workers = max_workers or min(32, len(items))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return list(ex.map(fn, items))
 
 
 def status(
     *,
     socket_path: str = DEFAULT_SOCKET_PATH,
+    cache: bool = False,
 ) -> RuntimeStatus:
     """Get Cortex runtime status.
 
     Args:
         socket_path: Path to the Cortex Unix socket.
+        cache: Return the status fetched within the last second, if any,
+            instead of asking the runtime again. Useful for tight polling loops.
 
     Returns:
         RuntimeStatus with version, uptime, and resource info.
@@ -372,9 +567,22 @@ def status(
         s = cortex_client.status()
         print(f"Cortex v{s.version}, {s.cached_maps} maps cached")
     """
-    ensure_running(socket_path)
-    conn = Connection(socket_path)
-    resp = conn.send("status")
+    if cache:
+        with _cache_lock:
+            hit = _status_cache.get(socket_path)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+    _ensure(socket_path)
+    resp = _pooled_send(socket_path, "status")
+    st = _runtime_status(resp)
+    if cache:
+        with _cache_lock:
+            _status_cache[socket_path] = (time.monotonic() + _STATUS_CACHE_TTL, st)
+    return st
+
+
+def _runtime_status(resp: dict[str, Any]) -> RuntimeStatus:
+    """Build a RuntimeStatus from a STATUS response, raising on error."""
     if "error" in resp:
         err = resp["error"]
         raise CortexConnectionError(
@@ -391,6 +599,139 @@ def status(
     )
 
 
+async def amap(
+    domain: str,
+    *,
+    session: Session | None = None,
+    max_nodes: int = 50000,
+    max_render: int = 200,
+    max_time_ms: int = 10000,
+    respect_robots: bool = True,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+    timeout_ms: int = 30000,
+) -> AsyncSiteMap:
+    """Asyncio variant of :func:`map`.
+
+    The returned :class:`AsyncSiteMap` keeps the :class:`AsyncConnection`
+    the MAP request was sent over; close it with ``await site.close()``.
+
+    Example::
+
+        site = await cortex_client.amap("amazon.com")
+    """
+    domain = normalize_domain(domain)
+    await _aensure(socket_path)
+    params = protocol.map_request(
+        domain,
+        max_nodes=max_nodes,
+        max_render=max_render,
+        max_time_ms=max_time_ms,
+        respect_robots=respect_robots,
+    )
+    if session is not None:
+        params["session_id"] = session.session_id
+    aconn = AsyncConnection(socket_path, timeout=(timeout_ms / 1000.0) + 15.0)
+    try:
+        resp = await aconn.send("map", params)
+    except BaseException as e:
+        await aconn.close()
+        if isinstance(e, CortexConnectionError):
+            _alive_until.pop(socket_path, None)
+        raise
+    if "error" in resp:
+        await aconn.close()
+    result = _map_result(resp)
+    return AsyncSiteMap(
+        conn=aconn,
+        domain=domain,
+        node_count=result.get("node_count", 0),
+        edge_count=result.get("edge_count", 0),
+        map_path=result.get("map_path"),
+    )
+
+
+async def amap_many(
+    domains: list[str],
+    *,
+    max_nodes: int = 50000,
+    max_render: int = 200,
+    max_time_ms: int = 10000,
+    respect_robots: bool = True,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+) -> list[AsyncSiteMap]:
+    """Asyncio variant of :func:`map_many`, gathering one task per domain.
+
+    Example::
+
+        sites = await cortex_client.amap_many(["amazon.com", "bestbuy.com"])
+    """
+    return list(
+        await asyncio.gather(
+            *(
+                amap(
+                    d,
+                    max_nodes=max_nodes,
+                    max_render=max_render,
+                    max_time_ms=max_time_ms,
+                    respect_robots=respect_robots,
+                    socket_path=socket_path,
+                )
+                for d in domains
+            )
+        )
+    )
+
+
+async def aperceive(
+    url: str,
+    *,
+    include_content: bool = True,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+) -> PageResult:
+    """Asyncio variant of :func:`perceive`.
+
+    Example::
+
+        page = await cortex_client.aperceive("https://example.com")
+    """
+    await _aensure(socket_path)
+    params = protocol.perceive_request(url, include_content=include_content)
+    resp = await _asend(socket_path, "perceive", params)
+    return _page_result(url, resp)
+
+
+async def aperceive_many(
+    urls: list[str],
+    *,
+    include_content: bool = True,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+) -> list[PageResult]:
+    """Asyncio variant of :func:`perceive_many`, gathering one task per URL."""
+    return list(
+        await asyncio.gather(
+            *(
+                aperceive(u, include_content=include_content, socket_path=socket_path)
+                for u in urls
+            )
+        )
+    )
+
+
+async def astatus(
+    *,
+    socket_path: str = DEFAULT_SOCKET_PATH,
+) -> RuntimeStatus:
+    """Asyncio variant of :func:`status`.
+
+    Example::
+
+        s = await cortex_client.astatus()
+    """
+    await _aensure(socket_path)
+    resp = await _asend(socket_path, "status")
+    return _runtime_status(resp)
+
+
 def login(
     domain: str,
     *,
@@ -602,7 +943,7 @@ def act(
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class CompareResult:
     """Result of comparing multiple site maps."""
 
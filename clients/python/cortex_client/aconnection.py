@@ -0,0 +1,189 @@
+# Copyright 2026 Cortex Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Asyncio Unix socket connection to the Cortex runtime."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Sequence
+
+from .connection import (
+    DEFAULT_SOCKET_PATH,
+    DEFAULT_TIMEOUT,
+    PIPELINE_DEPTH,
+    _dumps,
+    _loads,
+    _next_request_id,
+)
+from .errors import CortexConnectionError, CortexTimeoutError
+
+# Largest single response line the stream reader will buffer.
+STREAM_LIMIT = 64 * 1024 * 1024
+
+
+class AsyncConnection:
+    """Asyncio counterpart of :class:`~cortex_client.Connection`.
+
+    One event loop can keep many requests in flight without a thread per
+    request::
+
+        async with AsyncConnection() as conn:
+            result = await conn.send("status")
+    """
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        self._socket_path = socket_path
+        self._timeout = timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        # Serializes request/reply exchanges between tasks sharing this
+        # connection; replies arrive in request order.
+        self._lock = asyncio.Lock()
+
+    async def connect(self) -> None:
+        """Connect to the Cortex runtime socket.
+
+        Raises:
+            CortexConnectionError: If connection fails.
+        """
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(self._socket_path, limit=STREAM_LIMIT),
+                self._timeout,
+            )
+        except FileNotFoundError:
+            raise CortexConnectionError(
+                f"Cannot connect to Cortex at {self._socket_path}. "
+                "The process may not be running. Start it with: cortex start",
+                code="E_SOCKET_NOT_FOUND",
+            )
+        except PermissionError:
+            raise CortexConnectionError(
+                f"Permission denied on {self._socket_path}. "
+                "Check file permissions or run 'cortex stop && cortex start'.",
+                code="E_PERMISSION_DENIED",
+            )
+        except ConnectionRefusedError:
+            raise CortexConnectionError(
+                f"Cortex refused connection at {self._socket_path}. "
+                "The process may have crashed. Try 'cortex stop && cortex start'.",
+                code="E_CONNECTION_REFUSED",
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise CortexConnectionError(
+                f"Cannot connect to Cortex: {e}",
+                code="E_CONNECTION",
+            )
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._reader = None
+        self._writer = None
+
+    async def send(
+        self, method: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Send a request and return the response.
+
+        Auto-connects if not already connected. Tasks sharing a connection
+        take turns; the runtime answers one connection's requests in order,
+        so callers wanting concurrency should use one connection per task or
+        batch with :meth:`send_many`.
+
+        Args:
+            method: Protocol method name (e.g. ``"map"``, ``"query"``).
+            params: Method parameters.
+
+        Returns:
+            The response dict with ``"result"`` or ``"error"`` key.
+
+        Raises:
+            CortexConnectionError: If not connected or connection broken.
+            CortexTimeoutError: If the operation times out.
+        """
+        return (await self.send_many([(method, params)]))[0]
+
+    async def send_many(
+        self, requests: Sequence[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        """Pipeline several requests and return their responses in order.
+
+        Asyncio counterpart of :meth:`Connection.send_many
+        <cortex_client.Connection.send_many>`.
+        """
+        if not requests:
+            return []
+        responses: list[dict[str, Any]] = []
+        async with self._lock:
+            for start in range(0, len(requests), PIPELINE_DEPTH):
+                if self._writer is None:
+                    await self.connect()
+                window = requests[start : start + PIPELINE_DEPTH]
+                responses.extend(await self._exchange(window))
+        return responses
+
+    async def _exchange(
+        self, requests: Sequence[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        """Write all request frames, then read one reply per request."""
+        assert self._reader is not None and self._writer is not None
+        method = requests[0][0]
+        ids = [_next_request_id() for _ in requests]
+        frames = bytearray()
+        for request_id, (m, params) in zip(ids, requests):
+            frames += _dumps({"id": request_id, "method": m, "params": params or {}})
+            frames += b"\n"
+
+        try:
+            self._writer.write(frames)
+            await asyncio.wait_for(self._writer.drain(), self._timeout)
+            lines = [
+                await asyncio.wait_for(self._reader.readuntil(b"\n"), self._timeout)
+                for _ in ids
+            ]
+        except asyncio.TimeoutError:
+            await self.close()
+            raise CortexTimeoutError(
+                f"Timeout waiting for {method} response from Cortex. "
+                "The operation may be taking longer than expected. "
+                "Try increasing the timeout parameter.",
+                code="E_RECV_TIMEOUT",
+            )
+        except (asyncio.IncompleteReadError, ConnectionError):
+            await self.close()
+            raise CortexConnectionError(
+                "Connection closed by Cortex daemon. "
+                "The process may have crashed. "
+                "Check 'cortex doctor' for diagnostics.",
+                code="E_CONNECTION_CLOSED",
+            )
+
+        replies: list[dict[str, Any]] = [_loads(line) for line in lines]
+        by_id = {r.get("id"): r for r in replies}
+        return [by_id.get(i, r) for i, r in zip(ids, replies)]
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether this connection is currently open."""
+        return self._writer is not None
+
+    def __repr__(self) -> str:
+        status = "connected" if self.is_connected else "disconnected"
+        return f"AsyncConnection(path={self._socket_path!r}, {status})"
+
+    async def __aenter__(self) -> AsyncConnection:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
@@ -4,16 +4,141 @@
 
 from __future__ import annotations
 
+import itertools
 import json
+import os
+import queue
 import socket
+import threading
 import time
-from typing import Any
+from typing import Any, Sequence
 
 from .errors import CortexConnectionError, CortexTimeoutError
 
+try:
+    import orjson
+
+    _FAST_JSON = True
+
+    def _dumps(obj: Any) -> bytes:
+        """Encode ``obj`` as compact JSON bytes (int dict keys allowed)."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def _loads(data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover - exercised without the "fast" extra
+    _FAST_JSON = False
+
+    def _dumps(obj: Any) -> bytes:
+        """Encode ``obj`` as compact JSON bytes (int dict keys allowed)."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def _loads(data: bytes) -> Any:
+        """Decode JSON bytes."""
+        return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Encode ``obj`` as a compact JSON string, using orjson when installed.
+
+    Integer dict keys are written as strings, as on the wire.
+    """
+    return _dumps(obj).decode()
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Decode a JSON document, using orjson when installed.
+
+    Raises:
+        ValueError: If ``data`` is not valid JSON.
+    """
+    return _loads(data)
+
+
 DEFAULT_SOCKET_PATH = "/tmp/cortex.sock"
 DEFAULT_TIMEOUT = 60.0
 
+# Kernel socket buffer sizes requested on connect, so a large request or
+# response moves in fewer wakeups.
+SOCKET_BUFFER_SIZE = 256 * 1024
+
+# Report a closed peer as BrokenPipeError instead of raising SIGPIPE (Linux).
+_SEND_FLAGS = getattr(socket, "MSG_NOSIGNAL", 0)
+
+# Initial receive buffer size; the buffer doubles when a response outgrows it.
+RECV_BUFFER_SIZE = 64 * 1024
+
+# The runtime rejects any request ID it has already seen, across all
+# connections, so IDs are a per-process prefix plus a shared counter.
+_request_id_prefix = ""
+_request_ids = itertools.count()
+
+
+def _reset_request_ids() -> None:
+    global _request_id_prefix, _request_ids
+    _request_id_prefix = f"req-{os.getpid():x}-{time.time_ns():x}-"
+    _request_ids = itertools.count()
+
+
+_reset_request_ids()
+
+
+def _next_request_id() -> str:
+    """Return a request ID that is unique for the life of this process."""
+    return f"{_request_id_prefix}{next(_request_ids)}"
+
+
+# Most requests Connection.send_many writes before reading their replies.
+# Keeps unread replies from filling the socket buffers while the runtime
+# waits for us to drain them.
+PIPELINE_DEPTH = 32
+
+# Idle connection pool settings (see Connection.acquire / Connection.release).
+POOL_MAX_IDLE = 8
+POOL_IDLE_TTL = 30.0
+
+# Idle connections per socket path, most recently released on top.
+_pool: dict[str, queue.LifoQueue[tuple[float, Connection]]] = {}
+_pool_lock = threading.Lock()
+
+
+def _idle_queue(socket_path: str) -> queue.LifoQueue[tuple[float, Connection]]:
+    """Return the idle queue for a socket path, creating it on first use."""
+    with _pool_lock:
+        q = _pool.get(socket_path)
+        if q is None:
+            q = queue.LifoQueue(maxsize=POOL_MAX_IDLE)
+            _pool[socket_path] = q
+        return q
+
+
+def _reset_pool() -> None:
+    """Forget idle connections inherited across fork, leaving them open.
+
+    The parent still owns those sockets; closing or reusing them from the
+    child would interleave requests on the same runtime connection.
+    """
+    global _pool, _pool_lock
+    for q in _pool.values():
+        # Read the underlying deque: another thread may have held the
+        # queue's own lock at fork time.
+        for _, conn in q.queue:
+            if conn._sock is not None:
+                conn._sock.detach()
+                conn._sock = None
+    _pool = {}
+    _pool_lock = threading.Lock()
+
+
+def _after_fork_in_child() -> None:
+    _reset_request_ids()
+    _reset_pool()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
 
 class Connection:
     """Low-level connection to the Cortex runtime via Unix domain socket.
@@ -22,17 +147,100 @@ class Connection:
 
         with Connection() as conn:
             result = conn.send("status")
+
+    Short-lived callers can borrow an idle connection from a per-socket pool
+    instead of opening a new socket each time::
+
+        conn = Connection.acquire()
+        try:
+            result = conn.send("status")
+        finally:
+            conn.release()
+
+    With ``reader_thread=True`` a background thread receives and decodes
+    responses, so several threads can share one connection and the decode
+    of one response overlaps the wait for the next.
     """
 
     def __init__(
         self,
         socket_path: str = DEFAULT_SOCKET_PATH,
         timeout: float = DEFAULT_TIMEOUT,
+        *,
+        reader_thread: bool = False,
     ) -> None:
         self._socket_path = socket_path
         self._timeout = timeout
         self._sock: socket.socket | None = None
-        self._buffer = b""
+        # Receive buffer: bytes [_rpos, _rlen) are received but not yet
+        # consumed. Both reset to 0 whenever the buffer is drained.
+        self._rbuf = bytearray(RECV_BUFFER_SIZE)
+        self._rpos = 0
+        self._rlen = 0
+        # Outgoing frame buffer, reused across requests.
+        self._out = bytearray()
+        # Background reader mode: waiters keyed by request ID, in send order.
+        self._threaded = reader_thread
+        self._reader: threading.Thread | None = None
+        self._reading: socket.socket | None = None  # socket the reader serves
+        self._inbox: dict[str, queue.Queue[dict[str, Any] | None]] = {}
+        self._inbox_lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        # Why the reader gave up, reported to the waiters it fails.
+        self._reader_error: str | None = None
+
+    @classmethod
+    def acquire(
+        cls,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> Connection:
+        """Check out a pooled connection, or create a new one if none is idle.
+
+        Idle connections older than :data:`POOL_IDLE_TTL` seconds are closed
+        and discarded rather than reused.
+
+        Args:
+            socket_path: Path to the Cortex Unix socket.
+            timeout: Socket timeout in seconds for the checked-out connection.
+
+        Returns:
+            A connection that must be handed back with :meth:`release`.
+        """
+        idle = _idle_queue(socket_path)
+        now = time.monotonic()
+        while True:
+            try:
+                released_at, conn = idle.get_nowait()
+            except queue.Empty:
+                return cls(socket_path, timeout=timeout)
+            if now - released_at > POOL_IDLE_TTL or not conn.is_connected:
+                conn.close()
+                continue
+            conn._timeout = timeout
+            assert conn._sock is not None
+            conn._sock.settimeout(timeout)
+            return conn
+
+    def release(self) -> None:
+        """Return this connection to the idle pool.
+
+        Connections that are closed (e.g. after a broken pipe or timeout),
+        hold unread response bytes, or would overflow the pool are closed
+        instead of being kept. A receive buffer grown by a large response
+        is dropped back to its initial size so idle connections stay small.
+        """
+        if self._sock is None:
+            return
+        if self._rlen:
+            self.close()
+            return
+        if len(self._rbuf) > RECV_BUFFER_SIZE:
+            self._rbuf = bytearray(RECV_BUFFER_SIZE)
+        try:
+            _idle_queue(self._socket_path).put_nowait((time.monotonic(), self))
+        except queue.Full:
+            self.close()
 
     def connect(self) -> None:
         """Connect to the Cortex runtime socket.
@@ -41,9 +249,22 @@ class Connection:
             CortexConnectionError: If connection fails.
         """
         try:
-            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            self._sock.settimeout(self._timeout)
-            self._sock.connect(self._socket_path)
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._sock = sock
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.settimeout(self._timeout)
+            sock.connect(self._socket_path)
+            if self._threaded:
+                self._reader_error = None
+                self._reading = sock
+                self._reader = threading.Thread(
+                    target=self._reader_loop,
+                    args=(sock,),
+                    name="cortex-reader",
+                    daemon=True,
+                )
+                self._reader.start()
         except FileNotFoundError:
             raise CortexConnectionError(
                 f"Cannot connect to Cortex at {self._socket_path}. "
@@ -70,13 +291,22 @@ class Connection:
 
     def close(self) -> None:
         """Close the connection."""
-        if self._sock:
+        sock, self._sock = self._sock, None
+        if sock:
+            if self._reader is not None:
+                # Wakes the reader thread blocked in recv.
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
             try:
-                self._sock.close()
+                sock.close()
             except OSError:
                 pass
-            self._sock = None
-        self._buffer = b""
+        reader, self._reader = self._reader, None
+        if reader is not None and reader is not threading.current_thread():
+            reader.join()
+        self._rpos = self._rlen = 0
 
     def send(self, method: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Send a request and return the response.
@@ -94,26 +324,83 @@ class Connection:
             CortexConnectionError: If not connected or connection broken.
             CortexTimeoutError: If the operation times out.
         """
+        if self._threaded:
+            return self._send_via_reader([(method, params)])[0]
+
         if self._sock is None:
             self.connect()
 
         request = {
-            "id": f"req-{time.monotonic_ns()}",
+            "id": _next_request_id(),
             "method": method,
             "params": params or {},
         }
 
-        request_bytes = json.dumps(request).encode("utf-8") + b"\n"
+        out = self._out
+        out.clear()
+        out += _dumps(request)
+        out += b"\n"
+        self._write(out, method)
+        return self._read_response()
+
+    def send_many(
+        self, requests: Sequence[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        """Pipeline several requests and return their responses in order.
+
+        Request frames are written back-to-back before the replies are read,
+        so a batch costs about one round trip instead of one per request.
+
+        Args:
+            requests: ``(method, params)`` pairs.
+
+        Returns:
+            One response dict per request, in the same order.
+
+        Raises:
+            CortexConnectionError: If not connected or connection broken.
+            CortexTimeoutError: If the operation times out.
+
+        Example::
 
+            with Connection() as conn:
+                a, b = conn.send_many([("status", None), ("status", None)])
+        """
+        if not requests:
+            return []
+        if self._threaded:
+            return self._send_via_reader(requests)
+
+        responses: list[dict[str, Any]] = []
+        for start in range(0, len(requests), PIPELINE_DEPTH):
+            if self._sock is None:
+                self.connect()
+            window = requests[start : start + PIPELINE_DEPTH]
+            ids = [_next_request_id() for _ in window]
+            out = self._out
+            out.clear()
+            for request_id, (method, params) in zip(ids, window):
+                request = {"id": request_id, "method": method, "params": params or {}}
+                out += _dumps(request)
+                out += b"\n"
+            self._write(out, window[0][0])
+            replies = [self._read_response() for _ in ids]
+            by_id = {r.get("id"): r for r in replies}
+            responses.extend(by_id.get(i, r) for i, r in zip(ids, replies))
+        return responses
+
+    def _write(self, out: bytearray, method: str) -> None:
+        """Write request frames, reconnecting once on broken pipe."""
         try:
             assert self._sock is not None
-            self._sock.sendall(request_bytes)
+            self._sock.sendall(out, _SEND_FLAGS)
         except BrokenPipeError:
             self.close()
             self.connect()
             assert self._sock is not None
-            self._sock.sendall(request_bytes)
+            self._sock.sendall(out, _SEND_FLAGS)
         except socket.timeout:
+            self.close()
             raise CortexTimeoutError(
                 f"Timeout sending {method} request after {self._timeout:.0f}s. "
                 "The Cortex daemon may be overloaded. "
@@ -121,32 +408,168 @@ class Connection:
                 code="E_SEND_TIMEOUT",
             )
 
-        return self._read_response()
+    def _send_via_reader(
+        self, requests: Sequence[tuple[str, dict[str, Any] | None]]
+    ) -> list[dict[str, Any]]:
+        """Send requests and wait for the reader thread to deliver the replies."""
+        frames = bytearray()
+        waiting: list[tuple[str, str, queue.Queue[dict[str, Any] | None]]] = []
+        for method, params in requests:
+            request_id = _next_request_id()
+            request = {"id": request_id, "method": method, "params": params or {}}
+            frames += _dumps(request)
+            frames += b"\n"
+            waiting.append((method, request_id, queue.Queue(maxsize=1)))
 
-    def _read_response(self) -> dict[str, Any]:
-        """Read a newline-delimited JSON response."""
-        assert self._sock is not None
-        while b"\n" not in self._buffer:
+        # Registering and writing under one lock keeps the inbox in the same
+        # order as requests on the wire.
+        with self._send_lock:
+            if self._sock is None:
+                self.connect()
+            sock = self._sock
             try:
-                chunk = self._sock.recv(65536)
-            except socket.timeout:
-                raise CortexTimeoutError(
-                    "Timeout waiting for response from Cortex. "
-                    "The operation may be taking longer than expected. "
-                    "Try increasing the timeout parameter.",
-                    code="E_RECV_TIMEOUT",
-                )
-            if not chunk:
+                with self._inbox_lock:
+                    if sock is None or self._reading is not sock:
+                        raise BrokenPipeError  # the reader saw the peer hang up
+                    for _, request_id, reply in waiting:
+                        self._inbox[request_id] = reply
+                sock.sendall(frames, _SEND_FLAGS)
+            except OSError:
+                self.close()
                 raise CortexConnectionError(
-                    "Connection closed by Cortex daemon. "
-                    "The process may have crashed. "
+                    f"Cannot send {requests[0][0]} request: "
+                    "connection to Cortex lost. "
                     "Check 'cortex doctor' for diagnostics.",
                     code="E_CONNECTION_CLOSED",
                 )
-            self._buffer += chunk
 
-        line, self._buffer = self._buffer.split(b"\n", 1)
-        result: dict[str, Any] = json.loads(line.decode("utf-8"))
+        return [self._await_reply(method, reply) for method, _, reply in waiting]
+
+    def _await_reply(
+        self, method: str, reply: queue.Queue[dict[str, Any] | None]
+    ) -> dict[str, Any]:
+        """Wait for the reader thread to deliver one reply."""
+        try:
+            resp = reply.get(timeout=self._timeout)
+        except queue.Empty:
+            self.close()
+            raise CortexTimeoutError(
+                f"Timeout waiting for {method} response from Cortex. "
+                "The operation may be taking longer than expected. "
+                "Try increasing the timeout parameter.",
+                code="E_RECV_TIMEOUT",
+            )
+        if resp is None:
+            if self._reader_error is not None:
+                raise CortexConnectionError(
+                    self._reader_error, code="E_INVALID_RESPONSE"
+                )
+            raise CortexConnectionError(
+                "Connection closed by Cortex daemon. "
+                "The process may have crashed. "
+                "Check 'cortex doctor' for diagnostics.",
+                code="E_CONNECTION_CLOSED",
+            )
+        return resp
+
+    def _reader_loop(self, sock: socket.socket) -> None:
+        """Decode responses from ``sock`` and hand each to its waiter.
+
+        A malformed response leaves the stream unframed, so the reader
+        stops and fails every pending waiter instead of letting them time
+        out; the connection is closed so the pool discards it.
+        """
+        while True:
+            try:
+                line = self._recv_line(sock)
+            except socket.timeout:
+                continue  # idle; per-request timeouts are enforced by waiters
+            except OSError:
+                line = None
+            if line is None:
+                break
+            try:
+                resp: dict[str, Any] = _loads(line)
+                request_id = resp.get("id")
+            except (ValueError, AttributeError) as e:
+                self._reader_error = (
+                    f"Malformed response from Cortex: {e}. "
+                    "Check 'cortex doctor' for diagnostics."
+                )
+                break
+            with self._inbox_lock:
+                reply = self._inbox.pop(request_id, None)
+                if reply is None and self._inbox:
+                    # Replies come back in request order, so one without a
+                    # usable ID (e.g. a parse error) belongs to the oldest.
+                    reply = self._inbox.pop(next(iter(self._inbox)))
+            if reply is not None:
+                reply.put(resp)
+
+        with self._inbox_lock:
+            self._reading = None
+            waiting = list(self._inbox.values())
+            self._inbox.clear()
+        if self._sock is sock:
+            self.close()
+        for reply in waiting:
+            reply.put(None)
+
+    def _recv_line(self, sock: socket.socket) -> bytearray | None:
+        """Return the next line from ``sock`` without its newline, or None at EOF.
+
+        ``socket.timeout`` propagates with any partial line kept buffered.
+        """
+        # Only scan bytes that arrived since the last miss, so a response
+        # delivered in many small chunks is searched once in total.
+        buf = self._rbuf
+        scanned = self._rpos
+        while (idx := buf.find(b"\n", scanned, self._rlen)) == -1:
+            if self._rlen == len(buf):
+                if self._rpos:
+                    # Move the partial line to the front before growing.
+                    pending = self._rlen - self._rpos
+                    buf[:pending] = buf[self._rpos : self._rlen]
+                    self._rpos, self._rlen = 0, pending
+                if self._rlen == len(buf):
+                    buf.extend(bytes(len(buf)))
+            scanned = self._rlen
+            n = sock.recv_into(memoryview(buf)[self._rlen :])
+            if not n:
+                return None
+            self._rlen += n
+
+        # Pipelined replies are consumed in place; the buffer is only
+        # compacted when it fills, not once per line.
+        line = buf[self._rpos : idx]
+        if idx + 1 == self._rlen:
+            self._rpos = self._rlen = 0
+        else:
+            self._rpos = idx + 1
+        return line
+
+    def _read_response(self) -> dict[str, Any]:
+        """Read a newline-delimited JSON response."""
+        assert self._sock is not None
+        try:
+            line = self._recv_line(self._sock)
+        except socket.timeout:
+            self.close()
+            raise CortexTimeoutError(
+                "Timeout waiting for response from Cortex. "
+                "The operation may be taking longer than expected. "
+                "Try increasing the timeout parameter.",
+                code="E_RECV_TIMEOUT",
+            )
+        if line is None:
+            self.close()
+            raise CortexConnectionError(
+                "Connection closed by Cortex daemon. "
+                "The process may have crashed. "
+                "Check 'cortex doctor' for diagnostics.",
+                code="E_CONNECTION_CLOSED",
+            )
+        result: dict[str, Any] = _loads(line)
         return result
 
     @property
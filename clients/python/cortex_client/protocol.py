@@ -4,7 +4,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
 
 def map_request(
@@ -70,14 +70,14 @@ def pathfind_request(
 def refresh_request(
     domain: str,
     *,
-    nodes: list[int] | None = None,
+    nodes: Sequence[int] | None = None,
     cluster: int | None = None,
     stale_threshold: float | None = None,
 ) -> dict[str, Any]:
     """Build a REFRESH request."""
     params: dict[str, Any] = {"domain": domain}
     if nodes is not None:
-        params["nodes"] = nodes
+        params["nodes"] = _node_list(nodes)
     if cluster is not None:
         params["cluster"] = cluster
     if stale_threshold is not None:
@@ -106,6 +106,14 @@ def act_request(
     return result
 
 
+def _node_list(nodes: Sequence[int]) -> list[int]:
+    """Node indices as a JSON-encodable list (from arrays or lists)."""
+    if isinstance(nodes, list):
+        return nodes
+    tolist = getattr(nodes, "tolist", None)
+    return tolist() if tolist is not None else list(nodes)
+
+
 def perceive_request(
     url: str,
     *,
@@ -121,7 +129,7 @@ def perceive_request(
 def watch_request(
     domain: str,
     *,
-    nodes: list[int] | None = None,
+    nodes: Sequence[int] | None = None,
     cluster: int | None = None,
     features: list[int] | None = None,
     interval_ms: int = 60000,
@@ -129,7 +137,7 @@ def watch_request(
     """Build a WATCH request."""
     params: dict[str, Any] = {"domain": domain, "interval_ms": interval_ms}
     if nodes is not None:
-        params["nodes"] = nodes
+        params["nodes"] = _node_list(nodes)
     if cluster is not None:
         params["cluster"] = cluster
     if features is not None:
@@ -0,0 +1,125 @@
+# Copyright 2026 Cortex Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Client-side reranking of query results by feature distance.
+
+Example::
+
+    from cortex_client.rank import rerank_by_vector
+
+    batch = site.filter_arrays(page_type=0x04, limit=1000)
+    goal = [0.0] * 128
+    goal[48] = 250.0  # target price
+    best = [batch.row(i) for i in rerank_by_vector(batch, goal, k=10)]
+
+NumPy is used when installed and Numba additionally compiles the distance
+kernel (``pip install cortex-agent[rank]``); otherwise a pure-Python loop
+gives the same results.
+"""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any, Sequence
+
+from .sitemap import FEATURE_DIM, NodeMatchBatch
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised without the "rank" extra
+    np = None  # type: ignore[assignment]
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - exercised without the "rank" extra
+    njit = None  # type: ignore[assignment]
+
+
+def rerank_by_vector(
+    batch: NodeMatchBatch, goal: Sequence[float], k: int = 10
+) -> list[int]:
+    """Return the rows of ``batch`` closest to ``goal``, nearest first.
+
+    Distance is squared Euclidean over all 128 dimensions; dimensions a
+    match does not carry count as 0.
+
+    Args:
+        batch: Matches from :meth:`SiteMap.filter_arrays` or
+            :meth:`SiteMap.nearest_arrays`.
+        goal: A 128-dimension goal vector (any float sequence or array).
+        k: Number of rows to return.
+
+    Returns:
+        Row positions into ``batch``, usable with :meth:`NodeMatchBatch.row`.
+
+    Raises:
+        ValueError: If goal is not exactly 128 dimensions.
+    """
+    if len(goal) != FEATURE_DIM:
+        raise ValueError(
+            f"Goal vector must be {FEATURE_DIM} dimensions, got {len(goal)}"
+        )
+    n = len(batch)
+    k = min(k, n)
+    if k <= 0:
+        return []
+    if np is None:
+        dist = _distances_py(batch, goal)
+        return heapq.nsmallest(k, range(n), key=dist.__getitem__)
+
+    dist = _distances_np(batch, np.asarray(goal, dtype=np.float64))
+    top = np.argpartition(dist, k - 1)[:k]
+    result: list[int] = top[np.argsort(dist[top], kind="stable")].tolist()
+    return result
+
+
+def _distances_py(batch: NodeMatchBatch, goal: Sequence[float]) -> list[float]:
+    """Squared distances in pure Python, for installs without NumPy."""
+    indptr = batch.feature_indptr
+    dims = batch.feature_dims
+    values = batch.feature_values
+    # |v - g|^2 = |g|^2 + sum over v's nonzero dims of ((v - g)^2 - g^2)
+    base = sum(g * g for g in goal)
+    out = []
+    for i in range(len(indptr) - 1):
+        acc = base
+        for p in range(indptr[i], indptr[i + 1]):
+            g = goal[dims[p]]
+            d = values[p] - g
+            acc += d * d - g * g
+        out.append(acc)
+    return out
+
+
+def _distances_np(batch: NodeMatchBatch, goal: Any) -> Any:
+    """Squared distances over the batch's CSR feature columns."""
+    indptr = np.frombuffer(batch.feature_indptr, dtype=np.int32)
+    dims = np.frombuffer(batch.feature_dims, dtype=np.int32)
+    values = np.frombuffer(batch.feature_values, dtype=np.float32)
+    base = float(goal @ goal)
+    if _distances_jit is not None:
+        return _distances_jit(indptr, dims, values, goal, base)
+    g = goal[dims]
+    contrib = (values - g) ** 2 - g * g
+    rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+    return base + np.bincount(rows, weights=contrib, minlength=len(indptr) - 1)
+
+
+if njit is not None and np is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)  # type: ignore[misc]
+    def _distances_jit(
+        indptr: Any, dims: Any, values: Any, goal: Any, base: float
+    ) -> Any:
+        n = len(indptr) - 1
+        out = np.empty(n, dtype=np.float64)
+        for i in prange(n):
+            acc = base
+            for p in range(indptr[i], indptr[i + 1]):
+                g = goal[dims[p]]
+                d = values[p] - g
+                acc += d * d - g * g
+            out[i] = acc
+        return out
+
+else:
+    _distances_jit = None  # type: ignore[assignment]
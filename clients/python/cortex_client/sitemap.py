@@ -13,18 +13,37 @@ Example::
 
 from __future__ import annotations
 
+import math
+import queue
+import socket
+import threading
+import time
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Iterator
+from json.encoder import encode_basestring_ascii
+from typing import Any, Iterator, Sequence
 
-from .connection import Connection
-from .errors import CortexActError, CortexPathError, CortexResourceError
+from .aconnection import AsyncConnection
+from .connection import _FAST_JSON, Connection, _loads, json_dumps
+from .errors import CortexActError, CortexError, CortexPathError, CortexResourceError
 from . import protocol
 
 # Feature vector dimension count.
 FEATURE_DIM = 128
 
+# Most WatchDelta objects buffered between the watch reader thread and the
+# consumer; the reader stops receiving while the buffer is full.
+WATCH_QUEUE_SIZE = 1024
 
-@dataclass
+# SiteMap(cache_paths=True) keeps up to this many pathfind results, each
+# for this many seconds (the graph can change under a long-lived map).
+_PATH_CACHE_TTL = 30.0
+_PATH_CACHE_MAX = 1024
+_PathCache = OrderedDict[tuple[Any, ...], tuple[float, "Path | None"]]
+
+
+@dataclass(slots=True)
 class NodeMatch:
     """A matched node from a query.
 
@@ -54,7 +73,75 @@ class NodeMatch:
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class NodeMatchBatch:
+    """Query matches stored column-wise in packed arrays.
+
+    Row ``i`` across the columns describes one match. Features are kept in
+    CSR form: the dimensions and values of row ``i`` are
+    ``feature_dims[feature_indptr[i]:feature_indptr[i + 1]]`` and the same
+    slice of ``feature_values``. Missing similarities are NaN.
+
+    The arrays support the buffer protocol, so NumPy users can wrap them
+    without copying, e.g. ``np.frombuffer(batch.confidences, np.float32)``.
+
+    Example::
+
+        >>> batch = site.filter_arrays(page_type=0x04, limit=1000)
+        >>> batch
+        NodeMatchBatch(size=1000)
+        >>> best = max(range(len(batch)), key=batch.confidences.__getitem__)
+    """
+
+    indices: array[int]
+    page_types: array[int]
+    confidences: array[float]
+    similarities: array[float]
+    urls: list[str]
+    feature_indptr: array[int]
+    feature_dims: array[int]
+    feature_values: array[float]
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __repr__(self) -> str:
+        return f"NodeMatchBatch(size={len(self)})"
+
+    def row(self, i: int) -> NodeMatch:
+        """Materialize row ``i`` as a :class:`NodeMatch`."""
+        start, end = self.feature_indptr[i], self.feature_indptr[i + 1]
+        sim = self.similarities[i]
+        return NodeMatch(
+            index=self.indices[i],
+            url=self.urls[i],
+            page_type=self.page_types[i],
+            confidence=self.confidences[i],
+            features=dict(
+                zip(self.feature_dims[start:end], self.feature_values[start:end])
+            ),
+            similarity=None if math.isnan(sim) else sim,
+        )
+
+    def summary_json(self) -> str:
+        """Encode the index, url and page_type of each row as a JSON array.
+
+        Without orjson the array is written directly rather than through
+        dicts; only the URL needs escaping.
+        """
+        rows = zip(self.indices, self.urls, self.page_types)
+        if _FAST_JSON:
+            return json_dumps(
+                [{"index": i, "url": u, "page_type": t} for i, u, t in rows]
+            )
+        esc = encode_basestring_ascii
+        body = ",".join(
+            f'{{"index":{i},"url":{esc(u)},"page_type":{t}}}' for i, u, t in rows
+        )
+        return f"[{body}]"
+
+
+@dataclass(slots=True)
 class Path:
     """A path through the site graph.
 
@@ -77,7 +164,7 @@ class Path:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PathAction:
     """An action required at a specific node along a path."""
 
@@ -88,7 +175,7 @@ class PathAction:
         return f"PathAction(node={self.at_node}, opcode=({self.opcode[0]:#04x}, {self.opcode[1]:#04x}))"
 
 
-@dataclass
+@dataclass(slots=True)
 class RefreshResult:
     """Result of refreshing nodes.
 
@@ -108,7 +195,7 @@ class RefreshResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ActResult:
     """Result of executing an action.
 
@@ -128,7 +215,7 @@ class ActResult:
         return f"ActResult(success={self.success}{url})"
 
 
-@dataclass
+@dataclass(slots=True)
 class WatchDelta:
     """A change detected during watching."""
 
@@ -154,6 +241,10 @@ class SiteMap:
         SiteMap(domain='amazon.com', nodes=47832, edges=142891)
         >>> site.filter(page_type=0x04, limit=3)
         [NodeMatch(...), NodeMatch(...), NodeMatch(...)]
+
+    With ``cache_paths`` (the default), :meth:`pathfind` results are
+    reused for 30 seconds, until :meth:`refresh` or :meth:`act` changes
+    the map. Each call returns its own copy of the path.
     """
 
     def __init__(
@@ -164,8 +255,11 @@ class SiteMap:
         edge_count: int,
         map_path: str | None = None,
         cached: bool = False,
+        cache_paths: bool = True,
     ) -> None:
         self._conn = conn
+        self._path_cache: _PathCache | None = OrderedDict() if cache_paths else None
+        self._path_lock = threading.Lock()
         self.domain = domain
         self.node_count = node_count
         self.edge_count = edge_count
@@ -220,11 +314,58 @@ class SiteMap:
         resp = self._conn.send("query", params)
         return _parse_node_matches(resp)
 
-    def nearest(self, goal_vector: list[float], k: int = 10) -> list[NodeMatch]:
+    def filter_arrays(
+        self,
+        *,
+        page_type: int | list[int] | None = None,
+        features: dict[int, dict[str, float]] | None = None,
+        flags: dict[str, bool] | None = None,
+        sort_by: tuple[int, str] | None = None,
+        limit: int = 100,
+    ) -> NodeMatchBatch:
+        """Like :meth:`filter`, but return the matches as a :class:`NodeMatchBatch`.
+
+        Avoids one object per match, which pays off for large result sets
+        that are processed column-wise.
+        """
+        params = protocol.query_request(
+            self.domain,
+            page_type=page_type,
+            features=features,
+            flags=flags,
+            sort_by=sort_by,
+            limit=limit,
+        )
+        resp = self._conn.send("query", params)
+        return _parse_node_batch(resp)
+
+    def filter_many(self, filters: list[dict[str, Any]]) -> list[list[NodeMatch]]:
+        """Run several :meth:`filter` queries in one pipelined batch.
+
+        Args:
+            filters: Keyword arguments for each :meth:`filter` call.
+
+        Returns:
+            One match list per filter, in the same order.
+
+        Example::
+
+            products, articles = site.filter_many(
+                [{"page_type": 0x04, "limit": 20}, {"page_type": 0x05}]
+            )
+        """
+        requests = [
+            ("query", protocol.query_request(self.domain, **f)) for f in filters
+        ]
+        return [_parse_node_matches(r) for r in self._conn.send_many(requests)]
+
+    def nearest(self, goal_vector: Sequence[float], k: int = 10) -> list[NodeMatch]:
         """Find k nearest nodes by cosine similarity to a goal vector.
 
         Args:
             goal_vector: A 128-dimension feature vector to compare against.
+                Any float sequence works, including ``array.array`` and
+                NumPy arrays.
             k: Number of nearest neighbors to return.
 
         Returns:
@@ -241,16 +382,16 @@ class SiteMap:
             goal[48] = 250.0  # target price
             similar = site.nearest(goal, k=5)
         """
-        if len(goal_vector) != FEATURE_DIM:
-            raise ValueError(
-                f"Goal vector must be {FEATURE_DIM} dimensions, got {len(goal_vector)}"
-            )
-        params = protocol.query_request(self.domain, limit=k)
-        params["goal_vector"] = goal_vector
-        params["mode"] = "nearest"
-        resp = self._conn.send("query", params)
+        resp = self._conn.send("query", _nearest_params(self.domain, goal_vector, k))
         return _parse_node_matches(resp)
 
+    def nearest_arrays(
+        self, goal_vector: Sequence[float], k: int = 10
+    ) -> NodeMatchBatch:
+        """Like :meth:`nearest`, but return the matches as a :class:`NodeMatchBatch`."""
+        resp = self._conn.send("query", _nearest_params(self.domain, goal_vector, k))
+        return _parse_node_batch(resp)
+
     def pathfind(
         self,
         from_node: int,
@@ -281,6 +422,14 @@ class SiteMap:
                 for node in path.nodes:
                     print(f"  Visit node {node}")
         """
+        cache = self._path_cache
+        if cache is not None:
+            key = (from_node, to_node, minimize, tuple(avoid_flags or ()))
+            with self._path_lock:
+                hit = cache.get(key)
+                if hit is not None and hit[0] > time.monotonic():
+                    cache.move_to_end(key)
+                    return _copy_path(hit[1])
         params = protocol.pathfind_request(
             self.domain,
             from_node,
@@ -288,40 +437,28 @@ class SiteMap:
             avoid_flags=avoid_flags,
             minimize=minimize,
         )
-        resp = self._conn.send("pathfind", params)
-
-        if "error" in resp:
-            code = resp["error"].get("code", "")
-            if code == "E_NO_PATH":
-                return None
-            raise CortexPathError(
-                resp["error"].get("message", "pathfind error"),
-                code=code or "E_PATH_FAILED",
-            )
-
-        result = resp.get("result", {})
-        actions = [
-            PathAction(at_node=a["at_node"], opcode=tuple(a["opcode"]))
-            for a in result.get("required_actions", [])
-        ]
-        return Path(
-            nodes=result.get("nodes", []),
-            total_weight=result.get("total_weight", 0.0),
-            hops=result.get("hops", 0),
-            required_actions=actions,
-        )
+        path = _parse_path(self._conn.send("pathfind", params))
+        if cache is not None:
+            with self._path_lock:
+                cache[key] = (time.monotonic() + _PATH_CACHE_TTL, path)
+                cache.move_to_end(key)
+                while len(cache) > _PATH_CACHE_MAX:
+                    cache.popitem(last=False)
+            return _copy_path(path)
+        return path
 
     def refresh(
         self,
         *,
-        nodes: list[int] | None = None,
+        nodes: Sequence[int] | None = None,
         cluster: int | None = None,
         stale_threshold: float | None = None,
     ) -> RefreshResult:
         """Re-render specific nodes and update the map.
 
         Args:
-            nodes: Specific node indices to refresh.
+            nodes: Specific node indices to refresh. Any int sequence works,
+                including ``array('i')`` and NumPy arrays.
             cluster: Refresh all nodes in a cluster.
             stale_threshold: Only refresh nodes with freshness below this.
 
@@ -339,12 +476,20 @@ class SiteMap:
             cluster=cluster,
             stale_threshold=stale_threshold,
         )
-        resp = self._conn.send("refresh", params)
-        result = resp.get("result", {})
-        return RefreshResult(
-            updated_count=result.get("updated_count", 0),
-            changed_nodes=result.get("changed_nodes", []),
-        )
+        try:
+            return _parse_refresh(self._conn.send("refresh", params))
+        finally:
+            self._clear_paths()
+
+    def _clear_paths(self) -> None:
+        """Drop all cached paths.
+
+        A changed node can shorten routes that never passed through it, so
+        any change to the map invalidates every cached path.
+        """
+        if self._path_cache is not None:
+            with self._path_lock:
+                self._path_cache.clear()
 
     def act(
         self,
@@ -377,25 +522,15 @@ class SiteMap:
         req_params = protocol.act_request(
             self.domain, node, opcode, params=params, session_id=session_id
         )
-        resp = self._conn.send("act", req_params)
-
-        if "error" in resp:
-            raise CortexActError(
-                resp["error"].get("message", "action failed"),
-                code=resp["error"].get("code", "E_ACT_FAILED"),
-            )
-
-        result = resp.get("result", {})
-        return ActResult(
-            success=result.get("success", False),
-            new_url=result.get("new_url"),
-            features=result.get("features", {}),
-        )
+        try:
+            return _parse_act(self._conn.send("act", req_params))
+        finally:
+            self._clear_paths()
 
     def watch(
         self,
         *,
-        nodes: list[int] | None = None,
+        nodes: Sequence[int] | None = None,
         cluster: int | None = None,
         features: list[int] | None = None,
         interval_ms: int = 60000,
@@ -403,13 +538,19 @@ class SiteMap:
         """Monitor nodes for changes over time.
 
         Args:
-            nodes: Specific node indices to watch.
+            nodes: Specific node indices to watch (any int sequence).
             cluster: Watch all nodes in a cluster.
             features: Feature dimensions to monitor.
             interval_ms: Check interval in milliseconds.
 
         Returns:
             Iterator yielding WatchDelta objects as changes are detected.
+            It ends when the runtime closes the watch; ``close()`` (or
+            using it as a context manager) stops watching early. Runtimes
+            without WATCH support yield nothing.
+
+        Raises:
+            CortexError: If the runtime rejects the watch request.
 
         Example::
 
@@ -423,8 +564,366 @@ class SiteMap:
             features=features,
             interval_ms=interval_ms,
         )
-        self._conn.send("watch", params)
-        return iter([])
+        # Deltas stream on a dedicated connection so they never interleave
+        # with replies to other requests on this SiteMap.
+        conn = Connection(self._conn._socket_path, timeout=self._conn._timeout)
+        try:
+            resp = conn.send("watch", params)
+        except BaseException:
+            conn.close()
+            raise
+        if "error" in resp:
+            conn.close()
+            err = resp["error"]
+            if err.get("code") == "E_NOT_IMPLEMENTED":
+                return iter([])
+            raise CortexError(
+                err.get("message", "watch failed"),
+                code=err.get("code", "E_WATCH_FAILED"),
+            )
+        subscription = resp.get("result", {}).get("subscription_id")
+        return _WatchStream(conn, subscription)
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        self._conn.close()
+
+
+class AsyncSiteMap:
+    """Asyncio counterpart of :class:`SiteMap`, returned by :func:`cortex_client.amap`.
+
+    Methods are coroutines over an :class:`~cortex_client.AsyncConnection`,
+    so an event loop can overlap queries on different sites::
+
+        site = await cortex_client.amap("amazon.com")
+        products, deals = await site.filter_many(
+            [{"page_type": 0x04}, {"flags": {"has_price": True}}]
+        )
+    """
+
+    def __init__(
+        self,
+        conn: AsyncConnection,
+        domain: str,
+        node_count: int,
+        edge_count: int,
+        map_path: str | None = None,
+        cached: bool = False,
+    ) -> None:
+        self._conn = conn
+        self.domain = domain
+        self.node_count = node_count
+        self.edge_count = edge_count
+        self.map_path = map_path
+        self.cached = cached
+
+    def __repr__(self) -> str:
+        cached_str = ", cached=True" if self.cached else ""
+        return (
+            f"AsyncSiteMap(domain={self.domain!r}, nodes={self.node_count}, "
+            f"edges={self.edge_count}{cached_str})"
+        )
+
+    async def filter(
+        self,
+        *,
+        page_type: int | list[int] | None = None,
+        features: dict[int, dict[str, float]] | None = None,
+        flags: dict[str, bool] | None = None,
+        sort_by: tuple[int, str] | None = None,
+        limit: int = 100,
+    ) -> list[NodeMatch]:
+        """See :meth:`SiteMap.filter`."""
+        params = protocol.query_request(
+            self.domain,
+            page_type=page_type,
+            features=features,
+            flags=flags,
+            sort_by=sort_by,
+            limit=limit,
+        )
+        return _parse_node_matches(await self._conn.send("query", params))
+
+    async def filter_many(self, filters: list[dict[str, Any]]) -> list[list[NodeMatch]]:
+        """See :meth:`SiteMap.filter_many`."""
+        requests = [
+            ("query", protocol.query_request(self.domain, **f)) for f in filters
+        ]
+        return [_parse_node_matches(r) for r in await self._conn.send_many(requests)]
+
+    async def nearest(
+        self, goal_vector: Sequence[float], k: int = 10
+    ) -> list[NodeMatch]:
+        """See :meth:`SiteMap.nearest`."""
+        params = _nearest_params(self.domain, goal_vector, k)
+        return _parse_node_matches(await self._conn.send("query", params))
+
+    async def pathfind(
+        self,
+        from_node: int,
+        to_node: int,
+        *,
+        avoid_flags: list[str] | None = None,
+        minimize: str = "hops",
+    ) -> Path | None:
+        """See :meth:`SiteMap.pathfind`."""
+        params = protocol.pathfind_request(
+            self.domain,
+            from_node,
+            to_node,
+            avoid_flags=avoid_flags,
+            minimize=minimize,
+        )
+        return _parse_path(await self._conn.send("pathfind", params))
+
+    async def refresh(
+        self,
+        *,
+        nodes: Sequence[int] | None = None,
+        cluster: int | None = None,
+        stale_threshold: float | None = None,
+    ) -> RefreshResult:
+        """See :meth:`SiteMap.refresh`."""
+        params = protocol.refresh_request(
+            self.domain,
+            nodes=nodes,
+            cluster=cluster,
+            stale_threshold=stale_threshold,
+        )
+        return _parse_refresh(await self._conn.send("refresh", params))
+
+    async def act(
+        self,
+        node: int,
+        opcode: tuple[int, int],
+        params: dict[str, Any] | None = None,
+        session_id: str | None = None,
+    ) -> ActResult:
+        """See :meth:`SiteMap.act`."""
+        req_params = protocol.act_request(
+            self.domain, node, opcode, params=params, session_id=session_id
+        )
+        return _parse_act(await self._conn.send("act", req_params))
+
+    async def close(self) -> None:
+        """Close the underlying connection."""
+        await self._conn.close()
+
+
+# Queue marker for the end of a watch stream.
+_WATCH_END = object()
+
+
+class _WatchStream:
+    """Iterator over the deltas pushed for one watch; owns its connection.
+
+    A daemon thread starts reading on the first ``next()`` and buffers up to
+    :data:`WATCH_QUEUE_SIZE` deltas. :meth:`close` (also run on exhaustion,
+    by ``with`` and on garbage collection) stops the thread and closes the
+    socket, so a stream that is never iterated leaks nothing.
+    """
+
+    def __init__(self, conn: Connection, subscription: str | None) -> None:
+        self._conn = conn
+        self._subscription = subscription
+        self._deltas: queue.Queue[Any] = queue.Queue(maxsize=WATCH_QUEUE_SIZE)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def __iter__(self) -> _WatchStream:
+        return self
+
+    def __next__(self) -> WatchDelta:
+        if self._closed:
+            raise StopIteration
+        if self._thread is None:
+            # The thread must not reference self, or __del__ could never run.
+            self._thread = threading.Thread(
+                target=_read_watch_deltas,
+                args=(self._conn, self._subscription, self._deltas, self._stop),
+                name="cortex-watch",
+                daemon=True,
+            )
+            self._thread.start()
+        item = self._deltas.get()
+        if item is _WATCH_END:
+            self.close()
+            raise StopIteration
+        return item
+
+    def close(self) -> None:
+        """Stop watching and close the connection."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        sock = self._conn._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)  # wake the reader if in recv
+            except OSError:
+                pass
+        if self._thread is not None:
+            self._thread.join()
+        self._conn.close()
+
+    def __enter__(self) -> _WatchStream:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+def _read_watch_deltas(
+    conn: Connection,
+    subscription: str | None,
+    deltas: queue.Queue[Any],
+    stop: threading.Event,
+) -> None:
+    """Reader thread body: queue deltas pushed on ``conn`` until EOF or ``stop``."""
+    sock = conn._sock
+    assert sock is not None
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                deltas.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        while not stop.is_set():
+            try:
+                line = conn._recv_line(sock)
+            except socket.timeout:
+                continue  # quiet interval
+            except OSError:
+                break
+            if line is None:
+                break
+            delta = _parse_watch_delta(_loads(line), subscription)
+            if delta is not None and not put(delta):
+                break
+    finally:
+        put(_WATCH_END)
+
+
+def _parse_watch_delta(
+    msg: dict[str, Any], subscription: str | None
+) -> WatchDelta | None:
+    """Parse one pushed watch frame; frames for other subscriptions give None."""
+    data = msg.get("result", msg)
+    if not isinstance(data, dict) or "node" not in data:
+        return None
+    sub = data.get("subscription_id", subscription)
+    if subscription is not None and sub != subscription:
+        return None
+    changed = data.get("changed_features", [])
+    # The runtime serializes changes as [dim, old, new] triples; accept the
+    # {dim: [old, new]} shape as well.
+    items = (
+        ((d, (o, n)) for d, o, n in changed)
+        if isinstance(changed, list)
+        else ((int(d), (o, n)) for d, (o, n) in changed.items())
+    )
+    return WatchDelta(
+        node=data["node"],
+        changed_features=dict(items),
+        timestamp=data.get("timestamp", 0.0),
+    )
+
+
+def _nearest_params(
+    domain: str, goal_vector: Sequence[float], k: int
+) -> dict[str, Any]:
+    """Build the QUERY params for a nearest-neighbor search."""
+    if len(goal_vector) != FEATURE_DIM:
+        raise ValueError(
+            f"Goal vector must be {FEATURE_DIM} dimensions, got {len(goal_vector)}"
+        )
+    params = protocol.query_request(domain, limit=k)
+    params["goal_vector"] = _encode_goal_vector(goal_vector)
+    params["mode"] = "nearest"
+    return params
+
+
+def _copy_path(path: Path | None) -> Path | None:
+    """Copy a cached path so callers cannot mutate the cached one."""
+    if path is None:
+        return None
+    return Path(
+        list(path.nodes),
+        path.total_weight,
+        path.hops,
+        [PathAction(a.at_node, a.opcode) for a in path.required_actions],
+    )
+
+
+def _parse_path(resp: dict[str, Any]) -> Path | None:
+    """Parse a PATHFIND response; ``E_NO_PATH`` becomes None."""
+    if "error" in resp:
+        code = resp["error"].get("code", "")
+        if code == "E_NO_PATH":
+            return None
+        raise CortexPathError(
+            resp["error"].get("message", "pathfind error"),
+            code=code or "E_PATH_FAILED",
+        )
+
+    result = resp.get("result", {})
+    actions = []
+    for a in result.get("required_actions", ()):
+        category, action = a["opcode"]
+        actions.append(PathAction(a["at_node"], (category, action)))
+    return Path(
+        nodes=result.get("nodes", []),
+        total_weight=result.get("total_weight", 0.0),
+        hops=result.get("hops", 0),
+        required_actions=actions,
+    )
+
+
+def _parse_refresh(resp: dict[str, Any]) -> RefreshResult:
+    """Parse a REFRESH response."""
+    result = resp.get("result", {})
+    return RefreshResult(
+        updated_count=result.get("updated_count", 0),
+        changed_nodes=result.get("changed_nodes", []),
+    )
+
+
+def _parse_act(resp: dict[str, Any]) -> ActResult:
+    """Parse an ACT response, raising on error."""
+    if "error" in resp:
+        raise CortexActError(
+            resp["error"].get("message", "action failed"),
+            code=resp["error"].get("code", "E_ACT_FAILED"),
+        )
+
+    result = resp.get("result", {})
+    return ActResult(
+        success=result.get("success", False),
+        new_url=result.get("new_url"),
+        features=result.get("features", {}),
+    )
+
+
+def _encode_goal_vector(goal_vector: Sequence[float]) -> list[float]:
+    """Convert a goal vector to plain floats at float32 precision.
+
+    The runtime parses the vector as ``f32``. Each component is rounded to
+    ``f32`` first and then written with nine significant digits, which is
+    enough for that ``f32`` to parse back exactly; formatting the double
+    directly would round twice and can land on a neighbouring ``f32``.
+    """
+    values = goal_vector.tolist() if hasattr(goal_vector, "tolist") else goal_vector
+    return [float(f"{x:.9g}") for x in array("f", values).tolist()]
 
 
 def _parse_node_matches(resp: dict[str, Any]) -> list[NodeMatch]:
@@ -437,19 +936,63 @@ def _parse_node_matches(resp: dict[str, Any]) -> list[NodeMatch]:
 
     result = resp.get("result", {})
     matches = result.get("matches", [])
+    # Positional arguments in field order: index, url, page_type,
+    # confidence, features, similarity.
     return [
         NodeMatch(
-            index=m.get("index", 0),
-            url=m.get("url", ""),
-            page_type=m.get("page_type", 0),
-            confidence=m.get("confidence", 0.0),
-            features=m.get("features", {}),
-            similarity=m.get("similarity"),
+            m.get("index", 0),
+            m.get("url", ""),
+            m.get("page_type", 0),
+            m.get("confidence", 0.0),
+            m.get("features", {}),
+            m.get("similarity"),
         )
         for m in matches
     ]
 
 
+def _parse_node_batch(resp: dict[str, Any]) -> NodeMatchBatch:
+    """Parse node matches from a protocol response into packed columns."""
+    if "error" in resp:
+        raise CortexResourceError(
+            resp["error"].get("message", "query error"),
+            code=resp["error"].get("code", "E_NOT_FOUND"),
+        )
+
+    matches = resp.get("result", {}).get("matches", [])
+    indices = array("i")
+    page_types = array("i")
+    confidences = array("f")
+    similarities = array("f")
+    urls: list[str] = []
+    indptr = array("i", [0])
+    dims = array("i")
+    values = array("f")
+    nan = math.nan
+    for m in matches:
+        indices.append(m.get("index", 0))
+        page_types.append(m.get("page_type", 0))
+        confidences.append(m.get("confidence", 0.0))
+        sim = m.get("similarity")
+        similarities.append(nan if sim is None else sim)
+        urls.append(m.get("url", ""))
+        feats = m.get("features")
+        if feats:
+            dims.extend(map(int, feats.keys()))
+            values.extend(feats.values())
+        indptr.append(len(dims))
+    return NodeMatchBatch(
+        indices=indices,
+        page_types=page_types,
+        confidences=confidences,
+        similarities=similarities,
+        urls=urls,
+        feature_indptr=indptr,
+        feature_dims=dims,
+        feature_values=values,
+    )
+
+
 # Page type display names for repr.
 _PAGE_TYPE_NAMES: dict[int, str] = {
     0x00: "unknown",
@@ -0,0 +1,588 @@
+# Copyright 2026 Cortex Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the socket connection layer (no runtime required)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import tempfile
+import threading
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from cortex_client import connection
+from cortex_client.connection import Connection
+
+
+# ---------------------------------------------------------------------------
+# Fake runtime
+# ---------------------------------------------------------------------------
+
+
+class FakeRuntime:
+    """Minimal newline-delimited JSON server that echoes requests back."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.accepted = 0
+        self.requests: list[dict[str, Any]] = []
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def _serve(self) -> None:
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return
+            self.accepted += 1
+            threading.Thread(target=self._handle, args=(client,), daemon=True).start()
+
+    def _handle(self, client: socket.socket) -> None:
+        with client, client.makefile("rb") as reader:
+            for line in reader:
+                req = json.loads(line)
+                self.requests.append(req)
+                resp = {"id": req["id"], **self.respond(req)}
+                client.sendall(json.dumps(resp).encode() + b"\n")
+
+    def respond(self, req: dict[str, Any]) -> dict[str, Any]:
+        return {"result": {"method": req["method"], "params": req["params"]}}
+
+    def close(self) -> None:
+        self._server.close()
+
+
+@pytest.fixture
+def runtime() -> Iterator[FakeRuntime]:
+    path = os.path.join(tempfile.mkdtemp(), "cortex.sock")
+    rt = FakeRuntime(path)
+    yield rt
+    rt.close()
+    connection._pool.pop(path, None)
+
+
+# ---------------------------------------------------------------------------
+# Request/response
+# ---------------------------------------------------------------------------
+
+
+class TestSend:
+    def test_round_trip(self, runtime: FakeRuntime) -> None:
+        with Connection(runtime.path) as conn:
+            resp = conn.send("status")
+        assert resp["result"] == {"method": "status", "params": {}}
+
+    def test_sequential_requests_share_socket(self, runtime: FakeRuntime) -> None:
+        with Connection(runtime.path) as conn:
+            conn.send("status")
+            conn.send("query", {"domain": "example.com"})
+        assert runtime.accepted == 1
+        assert runtime.requests[1]["params"] == {"domain": "example.com"}
+
+    def test_response_larger_than_buffer(self, runtime: FakeRuntime) -> None:
+        blob = "x" * (connection.RECV_BUFFER_SIZE * 3)
+        with Connection(runtime.path) as conn:
+            resp = conn.send("query", {"blob": blob})
+            assert resp["result"]["params"]["blob"] == blob
+            assert conn.send("status")["result"]["method"] == "status"
+
+    def test_send_many_pipelines_in_order(self, runtime: FakeRuntime) -> None:
+        count = connection.PIPELINE_DEPTH + 3
+        with Connection(runtime.path) as conn:
+            resps = conn.send_many([("query", {"i": i}) for i in range(count)])
+            assert conn.send_many([]) == []
+        assert [r["result"]["params"]["i"] for r in resps] == list(range(count))
+        assert runtime.accepted == 1
+
+    def test_send_many_replies_straddle_buffer(self, runtime: FakeRuntime) -> None:
+        blobs = [str(i) * (connection.RECV_BUFFER_SIZE // 3) for i in range(10)]
+        with Connection(runtime.path) as conn:
+            resps = conn.send_many([("query", {"blob": b}) for b in blobs])
+            assert conn.send("status")["result"]["method"] == "status"
+        assert [r["result"]["params"]["blob"] for r in resps] == blobs
+
+    def test_int_feature_keys_encode(self, runtime: FakeRuntime) -> None:
+        with Connection(runtime.path) as conn:
+            resp = conn.send("query", {"features": {48: {"lt": 300}}})
+        assert resp["result"]["params"] == {"features": {"48": {"lt": 300}}}
+
+    def test_request_ids_unique_across_connections(
+        self, runtime: FakeRuntime
+    ) -> None:
+        for _ in range(2):
+            with Connection(runtime.path) as conn:
+                conn.send("status")
+                conn.send("status")
+        ids = [r["id"] for r in runtime.requests]
+        assert len(set(ids)) == 4
+        assert all(isinstance(i, str) for i in ids)
+
+
+class TestReaderThread:
+    def test_round_trip(self, runtime: FakeRuntime) -> None:
+        with Connection(runtime.path, reader_thread=True) as conn:
+            assert conn.send("status")["result"]["method"] == "status"
+            blob = "x" * (connection.RECV_BUFFER_SIZE * 2)
+            assert conn.send("query", {"blob": blob})["result"]["params"] == {
+                "blob": blob
+            }
+        assert not conn.is_connected
+
+    def test_threads_share_connection(self, runtime: FakeRuntime) -> None:
+        results: dict[int, Any] = {}
+
+        def worker(conn: Connection, i: int) -> None:
+            results[i] = conn.send("query", {"i": i})["result"]["params"]["i"]
+
+        with Connection(runtime.path, reader_thread=True) as conn:
+            threads = [
+                threading.Thread(target=worker, args=(conn, i)) for i in range(16)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        assert results == {i: i for i in range(16)}
+        assert runtime.accepted == 1
+
+    def test_send_many(self, runtime: FakeRuntime) -> None:
+        with Connection(runtime.path, reader_thread=True) as conn:
+            resps = conn.send_many([("query", {"i": i}) for i in range(5)])
+        assert [r["result"]["params"]["i"] for r in resps] == list(range(5))
+
+    def test_closed_by_peer(self, runtime: FakeRuntime) -> None:
+        from cortex_client import CortexConnectionError
+
+        runtime._handle = lambda client: client.close()  # type: ignore[method-assign]
+        conn = Connection(runtime.path, reader_thread=True)
+        with pytest.raises(CortexConnectionError) as exc:
+            conn.send("status")
+        assert exc.value.code == "E_CONNECTION_CLOSED"
+        conn.close()
+
+    def test_malformed_reply_fails_waiters(self, runtime: FakeRuntime) -> None:
+        import time
+
+        from cortex_client import CortexConnectionError
+
+        def handle(client: socket.socket) -> None:
+            with client, client.makefile("rb") as reader:
+                reader.readline()
+                client.sendall(b'{"id": "truncated\n')
+                reader.read()  # until the client hangs up
+
+        runtime._handle = handle  # type: ignore[method-assign]
+        conn = Connection(runtime.path, timeout=5.0, reader_thread=True)
+        started = time.monotonic()
+        with pytest.raises(CortexConnectionError) as exc:
+            conn.send("status")
+        assert exc.value.code == "E_INVALID_RESPONSE"
+        assert time.monotonic() - started < 2.0
+        assert not conn.is_connected
+        conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Connection pool
+# ---------------------------------------------------------------------------
+
+
+class TestPool:
+    def test_release_then_acquire_reuses(self, runtime: FakeRuntime) -> None:
+        conn = Connection.acquire(runtime.path)
+        conn.send("status")
+        conn.release()
+        again = Connection.acquire(runtime.path)
+        assert again is conn
+        again.send("status")
+        again.release()
+        assert runtime.accepted == 1
+
+    def test_unconnected_connection_not_pooled(self, runtime: FakeRuntime) -> None:
+        conn = Connection.acquire(runtime.path)
+        conn.release()
+        assert Connection.acquire(runtime.path) is not conn
+
+    def test_expired_connection_discarded(
+        self, runtime: FakeRuntime, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        conn = Connection.acquire(runtime.path)
+        conn.send("status")
+        conn.release()
+        monkeypatch.setattr(connection, "POOL_IDLE_TTL", -1.0)
+        fresh = Connection.acquire(runtime.path)
+        assert fresh is not conn
+        assert not conn.is_connected
+
+    def test_release_shrinks_grown_buffer(self, runtime: FakeRuntime) -> None:
+        conn = Connection.acquire(runtime.path)
+        conn.send("query", {"blob": "x" * (connection.RECV_BUFFER_SIZE * 3)})
+        assert len(conn._rbuf) > connection.RECV_BUFFER_SIZE
+        conn.release()
+        assert len(conn._rbuf) == connection.RECV_BUFFER_SIZE
+        again = Connection.acquire(runtime.path)
+        assert again is conn
+        assert again.send("status")["result"]["method"] == "status"
+        again.release()
+
+    def test_pool_is_bounded(self, runtime: FakeRuntime) -> None:
+        count = connection.POOL_MAX_IDLE + 2
+        conns = [Connection.acquire(runtime.path) for _ in range(count)]
+        for c in conns:
+            c.send("status")
+        for c in conns:
+            c.release()
+        assert sum(c.is_connected for c in conns) == connection.POOL_MAX_IDLE
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_fork_child_does_not_inherit_pool(self, runtime: FakeRuntime) -> None:
+        conn = Connection.acquire(runtime.path)
+        conn.send("status")
+        conn.release()
+        pid = os.fork()
+        if pid == 0:  # child: report through the exit status only
+            ok = not connection._pool and conn._sock is None
+            os._exit(0 if ok else 1)
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+        again = Connection.acquire(runtime.path)
+        assert again is conn
+        assert again.send("status")["result"]["method"] == "status"
+        again.release()
+
+    def test_map_over_given_connection(
+        self, runtime: FakeRuntime, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import cortex_client
+
+        def fail(path: str) -> None:
+            raise AssertionError("ensure_running should be skipped")
+
+        monkeypatch.setattr(cortex_client, "ensure_running", fail)
+        with Connection(runtime.path) as conn:
+            site = cortex_client.map("example.com", conn=conn)
+            site.filter(limit=1)
+        assert site._conn is conn
+        assert runtime.accepted == 1
+
+    def test_status_uses_pool(
+        self, runtime: FakeRuntime, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import cortex_client
+
+        monkeypatch.setattr(cortex_client, "ensure_running", lambda path: None)
+        cortex_client.status(socket_path=runtime.path)
+        cortex_client.status(socket_path=runtime.path)
+        assert runtime.accepted == 1
+
+
+# ---------------------------------------------------------------------------
+# Batch helpers
+# ---------------------------------------------------------------------------
+
+
+class TestMany:
+    def test_perceive_many_preserves_order(
+        self, runtime: FakeRuntime, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import cortex_client
+
+        monkeypatch.setattr(cortex_client, "ensure_running", lambda path: None)
+        urls = [f"https://example.com/{i}" for i in range(12)]
+        pages = cortex_client.perceive_many(urls, socket_path=runtime.path)
+        assert [p.url for p in pages] == urls
+        assert len(runtime.requests) == 12
+
+    def test_empty_batch(self) -> None:
+        import cortex_client
+
+        assert cortex_client.perceive_many([]) == []
+        assert cortex_client.map_many([]) == []
+
+
+# ---------------------------------------------------------------------------
+# Asyncio API
+# ---------------------------------------------------------------------------
+
+
+class TestAsync:
+    def test_async_round_trip(self, runtime: FakeRuntime) -> None:
+        from cortex_client import AsyncConnection
+
+        async def run() -> dict[str, Any]:
+            async with AsyncConnection(runtime.path) as conn:
+                return await conn.send("query", {"domain": "example.com"})
+
+        resp = asyncio.run(run())
+        assert resp["result"]["params"] == {"domain": "example.com"}
+
+    def test_async_send_many_and_shared_connection(
+        self, runtime: FakeRuntime
+    ) -> None:
+        from cortex_client import AsyncConnection
+
+        async def run() -> list[Any]:
+            async with AsyncConnection(runtime.path) as conn:
+                batch = await conn.send_many([("query", {"i": i}) for i in range(3)])
+                single = await asyncio.gather(
+                    *(conn.send("query", {"i": i}) for i in range(3, 6))
+                )
+                return [r["result"]["params"]["i"] for r in [*batch, *single]]
+
+        assert asyncio.run(run()) == list(range(6))
+        assert runtime.accepted == 1
+
+    def test_amap_returns_async_sitemap(
+        self, runtime: FakeRuntime, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import cortex_client
+
+        monkeypatch.setattr(cortex_client, "ensure_running", lambda path: None)
+
+        def respond(req: dict[str, Any]) -> dict[str, Any]:
+            if req["method"] == "map":
+                return {"result": {"node_count": 3, "edge_count": 2}}
+            return {"result": {"matches": [{"index": req["params"]["limit"]}]}}
+
+        runtime.respond = respond  # type: ignore[method-assign]
+
+        async def run() -> list[list[Any]]:
+            site = await cortex_client.amap("example.com", socket_path=runtime.path)
+            assert isinstance(site, cortex_client.AsyncSiteMap)
+            try:
+                return await site.filter_many([{"limit": 1}, {"limit": 2}])
+            finally:
+                await site.close()
+
+        results = asyncio.run(run())
+        assert [[m.index for m in r] for r in results] == [[1], [2]]
+        assert runtime.accepted == 1
+
+    def test_aperceive_many_preserves_order(
+        self, runtime: FakeRuntime, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import cortex_client
+
+        monkeypatch.setattr(cortex_client, "ensure_running", lambda path: None)
+        urls = [f"https://example.com/{i}" for i in range(5)]
+        pages = asyncio.run(
+            cortex_client.aperceive_many(urls, socket_path=runtime.path)
+        )
+        assert [p.url for p in pages] == urls
+
+    def test_async_connect_missing_socket(self) -> None:
+        from cortex_client import AsyncConnection, CortexConnectionError
+
+        conn = AsyncConnection("/nonexistent/cortex.sock")
+        with pytest.raises(CortexConnectionError) as exc:
+            asyncio.run(conn.connect())
+        assert exc.value.code == "E_SOCKET_NOT_FOUND"
+
+
+# ---------------------------------------------------------------------------
+# Result caches
+# ---------------------------------------------------------------------------
+
+
+class TestCache:
+    @pytest.fixture(autouse=True)
+    def _no_autostart(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        import cortex_client
+
+        monkeypatch.setattr(cortex_client, "ensure_running", lambda path: None)
+        cortex_client._map_cache.clear()
+        cortex_client._status_cache.clear()
+
+    def _map_calls(self, runtime: FakeRuntime) -> int:
+        return sum(1 for r in runtime.requests if r["method"] == "map")
+
+    def test_map_cache_hit(self, runtime: FakeRuntime) -> None:
+        import cortex_client
+
+        a = cortex_client.map("example.com", socket_path=runtime.path, cache=True)
+        b = cortex_client.map("example.com", socket_path=runtime.path, cache=True)
+        assert a is b
+        assert self._map_calls(runtime) == 1
+
+    def test_map_cache_keyed_by_params(self, runtime: FakeRuntime) -> None:
+        import cortex_client
+
+        cortex_client.map("example.com", socket_path=runtime.path, cache=True)
+        cortex_client.map(
+            "example.com", max_render=5, socket_path=runtime.path, cache=True
+        )
+        cortex_client.map("example.com", socket_path=runtime.path)
+        assert self._map_calls(runtime) == 3
+
+    def test_map_cache_bypassed_with_conn(self, runtime: FakeRuntime) -> None:
+        import cortex_client
+
+        with Connection(runtime.path) as a, Connection(runtime.path) as b:
+            assert cortex_client.map("example.com", cache=True, conn=a)._conn is a
+            assert cortex_client.map("example.com", cache=True, conn=b)._conn is b
+        assert self._map_calls(runtime) == 2
+
+    def test_map_cache_expires(
+        self, runtime: FakeRuntime, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import cortex_client
+
+        monkeypatch.setattr(cortex_client, "_MAP_CACHE_TTL", -1.0)
+        cortex_client.map("example.com", socket_path=runtime.path, cache=True)
+        cortex_client.map("example.com", socket_path=runtime.path, cache=True)
+        assert self._map_calls(runtime) == 2
+
+    def test_map_error_not_cached(self, runtime: FakeRuntime) -> None:
+        import cortex_client
+
+        runtime.respond = lambda req: {  # type: ignore[method-assign]
+            "error": {"code": "E_MAP_FAILED", "message": "unreachable"}
+        }
+        with pytest.raises(cortex_client.CortexMapError, match="unreachable"):
+            cortex_client.map("example.com", socket_path=runtime.path, cache=True)
+        assert not cortex_client._map_cache
+
+    def test_status_cache(self, runtime: FakeRuntime) -> None:
+        import cortex_client
+
+        cortex_client.status(socket_path=runtime.path, cache=True)
+        cortex_client.status(socket_path=runtime.path, cache=True)
+        cortex_client.status(socket_path=runtime.path)
+        assert sum(1 for r in runtime.requests if r["method"] == "status") == 2
+
+
+# ---------------------------------------------------------------------------
+# Auto-start probe
+# ---------------------------------------------------------------------------
+
+
+class TestEnsure:
+    def test_alive_check_cached(
+        self, runtime: FakeRuntime, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import cortex_client
+
+        probes: list[str] = []
+        monkeypatch.setattr(cortex_client, "ensure_running", probes.append)
+        monkeypatch.setattr(cortex_client, "_alive_until", {})
+        cortex_client.status(socket_path=runtime.path)
+        cortex_client.perceive("https://example.com", socket_path=runtime.path)
+        assert probes == [runtime.path]
+
+    def test_connection_error_resets_alive(
+        self, runtime: FakeRuntime, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import cortex_client
+
+        probes: list[str] = []
+        monkeypatch.setattr(cortex_client, "ensure_running", probes.append)
+        monkeypatch.setattr(cortex_client, "_alive_until", {})
+        cortex_client.status(socket_path=runtime.path)
+        runtime.close()
+        os.unlink(runtime.path)
+        connection._pool.pop(runtime.path, None)
+        with pytest.raises(cortex_client.CortexConnectionError):
+            cortex_client.status(socket_path=runtime.path)
+        assert runtime.path not in cortex_client._alive_until
+
+
+# ---------------------------------------------------------------------------
+# Watch streaming
+# ---------------------------------------------------------------------------
+
+
+class TestWatch:
+    def _site(self, runtime: FakeRuntime) -> Any:
+        from cortex_client import SiteMap
+
+        return SiteMap(Connection(runtime.path), "example.com", 10, 20)
+
+    def test_streams_deltas_until_closed(self, runtime: FakeRuntime) -> None:
+        def handle(client: socket.socket) -> None:
+            with client, client.makefile("rb") as reader:
+                req = json.loads(reader.readline())
+                frames = [
+                    {"id": req["id"], "result": {"subscription_id": "w1"}},
+                    {"result": {"subscription_id": "w1", "node": 4,
+                                "changed_features": [[48, 300.0, 250.0]],
+                                "timestamp": 1.5}},
+                    {"result": {"subscription_id": "other", "node": 5,
+                                "changed_features": []}},
+                    {"subscription_id": "w1", "node": 6,
+                     "changed_features": {"52": [0.5, 0.75]}},
+                ]
+                payload = b"".join(json.dumps(f).encode() + b"\n" for f in frames)
+                client.sendall(payload)
+
+        runtime._handle = handle  # type: ignore[method-assign]
+        deltas = list(self._site(runtime).watch(nodes=[4, 6]))
+        assert [d.node for d in deltas] == [4, 6]
+        assert deltas[0].changed_features == {48: (300.0, 250.0)}
+        assert deltas[0].timestamp == 1.5
+        assert deltas[1].changed_features == {52: (0.5, 0.75)}
+
+    def test_not_implemented_yields_nothing(self, runtime: FakeRuntime) -> None:
+        runtime.respond = lambda req: {  # type: ignore[method-assign]
+            "error": {"code": "E_NOT_IMPLEMENTED", "message": "not implemented"}
+        }
+        assert list(self._site(runtime).watch()) == []
+
+    def test_error_raises(self, runtime: FakeRuntime) -> None:
+        from cortex_client import CortexError
+
+        runtime.respond = lambda req: {  # type: ignore[method-assign]
+            "error": {"code": "E_NOT_FOUND", "message": "no map"}
+        }
+        with pytest.raises(CortexError, match="no map"):
+            self._site(runtime).watch()
+
+    def test_closing_iterator_stops_watch(self, runtime: FakeRuntime) -> None:
+        done = threading.Event()
+
+        def handle(client: socket.socket) -> None:
+            with client, client.makefile("rb") as reader:
+                req = json.loads(reader.readline())
+                ack = {"id": req["id"], "result": {}}
+                client.sendall(json.dumps(ack).encode() + b"\n")
+                delta = {"result": {"node": 1, "changed_features": []}}
+                client.sendall(json.dumps(delta).encode() + b"\n")
+                reader.read()  # until the client hangs up
+                done.set()
+
+        runtime._handle = handle  # type: ignore[method-assign]
+        stream = self._site(runtime).watch()
+        assert next(stream).node == 1
+        stream.close()  # type: ignore[attr-defined]
+        assert done.wait(5)
+
+    def test_dropping_unstarted_iterator_releases_socket(
+        self, runtime: FakeRuntime
+    ) -> None:
+        import gc
+
+        done = threading.Event()
+
+        def handle(client: socket.socket) -> None:
+            with client, client.makefile("rb") as reader:
+                req = json.loads(reader.readline())
+                ack = {"id": req["id"], "result": {}}
+                client.sendall(json.dumps(ack).encode() + b"\n")
+                reader.read()  # until the client hangs up
+                done.set()
+
+        runtime._handle = handle  # type: ignore[method-assign]
+        stream = self._site(runtime).watch()
+        del stream
+        gc.collect()
+        assert done.wait(5)
+        assert not any(t.name == "cortex-watch" for t in threading.enumerate())
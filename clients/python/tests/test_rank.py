@@ -0,0 +1,57 @@
+# Copyright 2026 Cortex Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for client-side reranking (no runtime required)."""
+
+from __future__ import annotations
+
+import pytest
+
+from cortex_client import rank
+from cortex_client.sitemap import _parse_node_batch
+
+
+def _batch(features: list[dict[str, float]]):  # type: ignore[no-untyped-def]
+    matches = [{"index": 100 + i, "features": f} for i, f in enumerate(features)]
+    return _parse_node_batch({"result": {"matches": matches}})
+
+
+def _dense_distance(features: dict[str, float], goal: list[float]) -> float:
+    vec = [0.0] * 128
+    for d, v in features.items():
+        vec[int(d)] = v
+    return sum((a - b) ** 2 for a, b in zip(vec, goal))
+
+
+FEATURES = [
+    {"0": 1.0, "48": 300.0},
+    {"48": 250.0},
+    {},
+    {"0": 0.5, "48": 240.0, "52": 0.25},
+]
+
+
+@pytest.fixture(params=["native", "python"])
+def backend(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    if request.param == "python":
+        monkeypatch.setattr(rank, "np", None)
+    elif rank.np is None:
+        pytest.skip("numpy not installed")
+
+
+class TestRerank:
+    def test_orders_by_distance(self, backend: None) -> None:
+        goal = [0.0] * 128
+        goal[48] = 250.0
+        expected = sorted(
+            range(len(FEATURES)), key=lambda i: _dense_distance(FEATURES[i], goal)
+        )
+        assert rank.rerank_by_vector(_batch(FEATURES), goal, k=4) == expected
+        assert rank.rerank_by_vector(_batch(FEATURES), goal, k=2) == expected[:2]
+
+    def test_k_larger_than_batch(self, backend: None) -> None:
+        assert len(rank.rerank_by_vector(_batch(FEATURES), [0.0] * 128, k=99)) == 4
+        assert rank.rerank_by_vector(_batch([]), [0.0] * 128) == []
+
+    def test_goal_dimension_checked(self) -> None:
+        with pytest.raises(ValueError, match="128 dimensions"):
+            rank.rerank_by_vector(_batch(FEATURES), [0.0] * 3)
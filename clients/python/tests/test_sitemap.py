@@ -4,6 +4,10 @@
 
 from __future__ import annotations
 
+import json
+import random
+from array import array
+from collections.abc import Callable
 from unittest.mock import MagicMock
 
 import pytest
@@ -17,8 +21,16 @@ from cortex_client import (
     WatchDelta,
     PageResult,
     RuntimeStatus,
+    CortexResourceError,
+)
+from cortex_client import sitemap
+from cortex_client.sitemap import (
+    FEATURE_DIM,
+    SiteMap,
+    _encode_goal_vector,
+    _parse_node_batch,
+    _parse_node_matches,
 )
-from cortex_client.sitemap import SiteMap, _parse_node_matches
 from cortex_client.protocol import (
     map_request,
     query_request,
@@ -171,6 +183,18 @@ class TestParseNodeMatches:
         with pytest.raises(CortexResourceError, match="bad query"):
             _parse_node_matches(resp)
 
+    @pytest.mark.parametrize("fast", [True, False])
+    def test_summary_json(self, fast: bool, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(sitemap, "_FAST_JSON", fast)
+        url = 'https://a.com/"q"\\é'
+        batch = _parse_node_batch(
+            {"result": {"matches": [{"index": 3, "url": url, "page_type": 4}, {}]}}
+        )
+        assert json.loads(batch.summary_json()) == [
+            {"index": 3, "url": url, "page_type": 4},
+            {"index": 0, "url": "", "page_type": 0},
+        ]
+
 
 # ---------------------------------------------------------------------------
 # Protocol message builders
@@ -255,6 +279,19 @@ class TestSiteMapMethods:
         call_args = sm._conn.send.call_args
         assert call_args[0][0] == "query"
 
+    def test_filter_many_batches_queries(self) -> None:
+        sm = self._make_sitemap()
+        sm._conn.send_many.return_value = [
+            {"result": {"matches": [{"index": 1}]}},
+            {"result": {"matches": []}},
+        ]
+        results = sm.filter_many([{"page_type": 4}, {"limit": 5}])
+        assert [[m.index for m in r] for r in results] == [[1], []]
+        requests = sm._conn.send_many.call_args[0][0]
+        assert [m for m, _ in requests] == ["query", "query"]
+        assert requests[0][1]["page_type"] == [4]
+        assert requests[1][1]["limit"] == 5
+
     def test_nearest_sends_query_with_mode(self) -> None:
         sm = self._make_sitemap()
         sm._conn.send.return_value = {"result": {"matches": []}}
@@ -265,6 +302,61 @@ class TestSiteMapMethods:
         params = call_args[0][1]
         assert params["mode"] == "nearest"
 
+    def test_filter_arrays_packs_columns(self) -> None:
+        sm = self._make_sitemap()
+        sm._conn.send.return_value = {
+            "result": {
+                "matches": [
+                    {
+                        "index": 3,
+                        "url": "https://example.com/a",
+                        "page_type": 4,
+                        "confidence": 0.5,
+                        "features": {"0": 0.5, "48": 250.0},
+                        "similarity": None,
+                    },
+                    {"index": 9, "url": "https://example.com/b", "page_type": 5},
+                ]
+            }
+        }
+        batch = sm.filter_arrays(page_type=4)
+        assert len(batch) == 2
+        assert list(batch.indices) == [3, 9]
+        assert list(batch.page_types) == [4, 5]
+        assert list(batch.feature_indptr) == [0, 2, 2]
+        assert list(batch.feature_dims) == [0, 48]
+        row = batch.row(0)
+        assert row.features == {0: 0.5, 48: 250.0}
+        assert row.similarity is None
+        assert batch.row(1).features == {}
+
+    def test_nearest_arrays_error(self) -> None:
+        sm = self._make_sitemap()
+        sm._conn.send.return_value = {
+            "error": {"code": "E_NOT_FOUND", "message": "no map"}
+        }
+        with pytest.raises(CortexResourceError):
+            sm.nearest_arrays([0.0] * 128)
+
+    def test_nearest_accepts_array_at_float32_precision(self) -> None:
+        sm = self._make_sitemap()
+        sm._conn.send.return_value = {"result": {"matches": []}}
+        goal = array("d", [0.0] * 128)
+        goal[0] = 4
+        goal[1] = 0.123456789012345
+        sm.nearest(goal, k=5)
+        sent = sm._conn.send.call_args[0][1]["goal_vector"]
+        assert type(sent) is list and len(sent) == 128
+        assert sent[:2] == [4.0, 0.123456791]
+
+    def test_goal_vector_rounds_like_a_float32_cast(self) -> None:
+        rng = random.Random(1234)
+        values = [rng.uniform(-300.0, 300.0) for _ in range(50 * FEATURE_DIM)]
+        values[0] = 1.4601400494575498  # .9g of the double is the wrong f32
+        for start in range(0, len(values), FEATURE_DIM):
+            goal = values[start : start + FEATURE_DIM]
+            assert array("f", _encode_goal_vector(goal)) == array("f", goal)
+
     def test_pathfind_returns_path(self) -> None:
         sm = self._make_sitemap()
         sm._conn.send.return_value = {
@@ -288,6 +380,43 @@ class TestSiteMapMethods:
         }
         assert sm.pathfind(0, 99) is None
 
+    def test_pathfind_reuses_cached_path(self) -> None:
+        sm = self._make_sitemap()
+        sm._conn.send.return_value = {"result": {"nodes": [0, 3, 7], "hops": 2}}
+        first = sm.pathfind(0, 7)
+        assert first is not None
+        first.nodes.append(99)
+        assert sm.pathfind(0, 7).nodes == [0, 3, 7]  # type: ignore[union-attr]
+        assert sm._conn.send.call_count == 1
+        sm.pathfind(0, 7, minimize="weight")
+        assert sm._conn.send.call_count == 2
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda sm: sm.refresh(nodes=[3]),
+            lambda sm: sm.act(3, (2, 0)),
+        ],
+        ids=["refresh", "act"],
+    )
+    def test_map_changes_clear_cached_paths(
+        self, change: Callable[[SiteMap], object]
+    ) -> None:
+        sm = self._make_sitemap()
+        sm._conn.send.return_value = {"result": {"nodes": [0, 5], "hops": 1}}
+        sm.pathfind(0, 5)
+        sm._conn.send.return_value = {"result": {"success": True}}
+        change(sm)
+        sm._conn.send.return_value = {"result": {"nodes": [0, 3, 5], "hops": 2}}
+        assert sm.pathfind(0, 5).nodes == [0, 3, 5]  # type: ignore[union-attr]
+
+    def test_pathfind_cache_disabled(self) -> None:
+        sm = SiteMap(MagicMock(), "example.com", 100, 250, cache_paths=False)
+        sm._conn.send.return_value = {"result": {"nodes": [0, 7], "hops": 1}}
+        sm.pathfind(0, 7)
+        sm.pathfind(0, 7)
+        assert sm._conn.send.call_count == 2
+
     def test_refresh(self) -> None:
         sm = self._make_sitemap()
         sm._conn.send.return_value = {
@@ -297,6 +426,14 @@ class TestSiteMapMethods:
         assert result.updated_count == 3
         assert result.changed_nodes == [1, 5, 9]
 
+    def test_refresh_accepts_node_arrays(self) -> None:
+        sm = self._make_sitemap()
+        sm._conn.send.return_value = {"result": {"updated_count": 0}}
+        sm.refresh(nodes=array("i", [4, 2]))
+        params = sm._conn.send.call_args[0][1]
+        assert params["nodes"] == [4, 2]
+        assert type(params["nodes"]) is list
+
     def test_act(self) -> None:
         sm = self._make_sitemap()
         sm._conn.send.return_value = {
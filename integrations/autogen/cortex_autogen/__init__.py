@@ -2,6 +2,6 @@
 # SPDX-License-Identifier: Apache-2.0
 """AutoGen tools for Cortex web cartography."""
 
-from .tools import cortex_act, cortex_map, cortex_query
+from .tools import cortex_act, cortex_invalidate, cortex_map, cortex_query
 
-__all__ = ["cortex_map", "cortex_query", "cortex_act"]
+__all__ = ["cortex_map", "cortex_query", "cortex_act", "cortex_invalidate"]
@@ -19,10 +19,72 @@ Usage::
 """
 from __future__ import annotations
 
-import json
-from typing import Any, Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
 
 import cortex_client
+from cortex_client import json_dumps
+
+# SiteMaps already mapped in this process, by normalized domain. Mapping
+# renders pages, so the query and act tools reuse a map for up to
+# _SITEMAP_TTL seconds instead of re-mapping. Each entry carries a lock: a
+# SiteMap's connection must not serve two tool calls at once, and a miss
+# maps the site once while holding it.
+_SITEMAP_TTL = 300.0
+_SITEMAP_LOCK = threading.Lock()
+
+
+class _CachedSite:
+    """A cached SiteMap, its expiry time and the lock serializing its use."""
+
+    __slots__ = ("lock", "site", "expires")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.site: cortex_client.SiteMap | None = None
+        self.expires = 0.0
+
+    def replace(self, sm: cortex_client.SiteMap) -> None:
+        """Cache ``sm`` for _SITEMAP_TTL seconds, closing the map it replaces."""
+        old, self.site = self.site, sm
+        self.expires = time.monotonic() + _SITEMAP_TTL
+        if old is not None:
+            old.close()
+
+
+_SITEMAP_CACHE: dict[str, _CachedSite] = {}
+
+
+def _site_key(domain: str) -> str:
+    return cortex_client.normalize_domain(domain).lower()
+
+
+@contextmanager
+def _locked_entry(key: str) -> Iterator[_CachedSite]:
+    """Hold the lock of the current cache entry for ``key``."""
+    while True:
+        with _SITEMAP_LOCK:
+            entry = _SITEMAP_CACHE.get(key)
+            if entry is None:
+                entry = _SITEMAP_CACHE[key] = _CachedSite()
+        with entry.lock:
+            # An entry invalidated while we waited is no longer cached.
+            if _SITEMAP_CACHE.get(key) is entry:
+                yield entry
+                return
+
+
+@contextmanager
+def _use_site(domain: str) -> Iterator[cortex_client.SiteMap]:
+    """Hold the cached SiteMap for ``domain``, mapping it if missing or expired."""
+    key = _site_key(domain)
+    with _locked_entry(key) as entry:
+        if entry.site is None or entry.expires <= time.monotonic():
+            entry.replace(cortex_client.map(key, max_render=5))
+        assert entry.site is not None
+        yield entry.site
 
 
 def cortex_map(domain: str, max_render: int = 50) -> str:
@@ -35,8 +97,11 @@ def cortex_map(domain: str, max_render: int = 50) -> str:
     Returns:
         JSON summary of the mapped site.
     """
-    sm = cortex_client.map(domain, max_render=max_render)
-    return json.dumps(
+    key = _site_key(domain)
+    sm = cortex_client.map(key, max_render=max_render)
+    with _locked_entry(key) as entry:
+        entry.replace(sm)
+    return json_dumps(
         {
             "domain": sm.domain,
             "node_count": sm.node_count,
@@ -60,11 +125,9 @@ def cortex_query(
     Returns:
         JSON array of matching pages.
     """
-    sm = cortex_client.map(domain, max_render=5)
-    results = sm.filter(page_type=page_type, limit=limit)
-    return json.dumps(
-        [{"index": m.index, "url": m.url, "page_type": m.page_type} for m in results]
-    )
+    with _use_site(domain) as sm:
+        batch = sm.filter_arrays(page_type=page_type, limit=limit)
+    return batch.summary_json()
 
 
 def cortex_act(
@@ -84,6 +147,26 @@ def cortex_act(
     Returns:
         JSON result of the action.
     """
-    sm = cortex_client.map(domain, max_render=5)
-    result = sm.act(node, tuple(opcode), **(params or {}))
-    return json.dumps({"success": result.success, "new_url": result.new_url})
+    with _use_site(domain) as sm:
+        result = sm.act(node, (opcode[0], opcode[1]), params=params)
+    return json_dumps({"success": result.success, "new_url": result.new_url})
+
+
+def cortex_invalidate(domain: str) -> str:
+    """Forget a mapped site so the next query or action maps it again.
+
+    Args:
+        domain: Domain whose map should be discarded.
+
+    Returns:
+        JSON confirmation.
+    """
+    with _SITEMAP_LOCK:
+        entry = _SITEMAP_CACHE.pop(_site_key(domain), None)
+    removed = False
+    if entry is not None:
+        with entry.lock:
+            if entry.site is not None:
+                entry.site.close()
+                removed = True
+    return json_dumps({"domain": domain, "invalidated": removed})
@@ -0,0 +1,80 @@
+# Copyright 2026 Cortex Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the tools' SiteMap cache (no runtime required)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+import cortex_client
+from cortex_autogen import cortex_invalidate, cortex_map, cortex_query, tools
+
+
+class FakeSite:
+    """SiteMap stand-in that fails if two calls use it at once."""
+
+    def __init__(self, domain: str) -> None:
+        self.domain = domain
+        self.node_count = 1
+        self.edge_count = 0
+        self.closed = False
+        self.overlapped = False
+        self._busy = threading.Lock()
+
+    def filter_arrays(self, **kwargs: Any) -> Any:
+        if not self._busy.acquire(blocking=False):
+            self.overlapped = True
+            return self
+        time.sleep(0.01)
+        self._busy.release()
+        return self
+
+    def summary_json(self) -> str:
+        return "[]"
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def mapped(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[FakeSite]]:
+    sites: list[FakeSite] = []
+
+    def fake_map(domain: str, **kwargs: Any) -> FakeSite:
+        time.sleep(0.02)
+        sites.append(FakeSite(domain))
+        return sites[-1]
+
+    monkeypatch.setattr(cortex_client, "map", fake_map)
+    monkeypatch.setattr(tools, "_SITEMAP_CACHE", {})
+    yield sites
+
+
+def test_concurrent_calls_share_one_map(mapped: list[FakeSite]) -> None:
+    domains = ["Example.com", "https://example.com/x/", "example.com"] * 3
+    threads = [threading.Thread(target=cortex_query, args=(d,)) for d in domains]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert [s.domain for s in mapped] == ["example.com"]
+    assert not mapped[0].overlapped
+
+
+def test_expired_replaced_and_invalidated_maps_are_closed(
+    mapped: list[FakeSite], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cortex_query("example.com")
+    monkeypatch.setattr(tools, "_SITEMAP_TTL", -1.0)
+    cortex_map("Example.com")
+    assert mapped[0].closed
+    cortex_query("example.com")  # the map above has already expired
+    assert mapped[1].closed
+    assert '"invalidated":true' in cortex_invalidate("example.com/")
+    assert mapped[2].closed
+    assert '"invalidated":false' in cortex_invalidate("example.com")
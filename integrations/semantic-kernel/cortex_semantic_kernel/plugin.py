@@ -12,8 +12,10 @@ Usage::
 """
 from __future__ import annotations
 
-import json
-from typing import Annotated, Any, Optional
+import re
+import threading
+from contextlib import contextmanager
+from typing import Annotated, Any, Iterator, Optional
 
 try:
     from semantic_kernel.functions import kernel_function
@@ -31,10 +33,75 @@ except ImportError:  # pragma: no cover
 
 
 import cortex_client
+from cortex_client import json_dumps, json_loads
+
+# The usual opcode argument, e.g. "[2, 0]", parsed without a JSON decoder.
+_OPCODE_RE = re.compile(r"\s*\[\s*(\d+)\s*,\s*(\d+)\s*\]\s*")
+
+
+def _parse_opcode(opcode: str) -> tuple[int, int] | None:
+    """Parse a ``[category, action]`` opcode argument, or None if malformed."""
+    m = _OPCODE_RE.fullmatch(opcode)
+    if m is not None:
+        return (int(m[1]), int(m[2]))
+    try:
+        op = json_loads(opcode)
+    except ValueError:
+        return None
+    if isinstance(op, list) and len(op) == 2 and all(type(x) is int for x in op):
+        return (op[0], op[1])
+    return None
+
+
+def _site_key(domain: str) -> str:
+    return cortex_client.normalize_domain(domain).lower()
+
+
+class _CachedSite:
+    """A plugin's SiteMap for one domain and the lock serializing its use."""
+
+    __slots__ = ("lock", "site")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.site: cortex_client.SiteMap | None = None
 
 
 class CortexPlugin:
-    """Cortex web cartography plugin for Semantic Kernel."""
+    """Cortex web cartography plugin for Semantic Kernel.
+
+    The plugin keeps the SiteMap of every domain it has mapped, by
+    normalized domain, so query, pathfind and act reuse it instead of
+    re-mapping the site. A SiteMap's connection must not serve two kernel
+    calls at once, so calls on the same domain take turns.
+    """
+
+    def __init__(self) -> None:
+        self._sites: dict[str, _CachedSite] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked_entry(self, key: str) -> Iterator[_CachedSite]:
+        """Hold the lock of the current cache entry for ``key``."""
+        while True:
+            with self._lock:
+                entry = self._sites.get(key)
+                if entry is None:
+                    entry = self._sites[key] = _CachedSite()
+            with entry.lock:
+                # An entry invalidated while we waited is no longer cached.
+                if self._sites.get(key) is entry:
+                    yield entry
+                    return
+
+    @contextmanager
+    def _use_site(self, domain: str) -> Iterator[cortex_client.SiteMap]:
+        """Hold this plugin's SiteMap for ``domain``, mapping it on first use."""
+        key = _site_key(domain)
+        with self._locked_entry(key) as entry:
+            if entry.site is None:
+                entry.site = cortex_client.map(key, max_render=5)
+            yield entry.site
 
     @kernel_function(description="Map an entire website into a navigable graph.", name="cortex_map")
     def map_site(
@@ -42,8 +109,13 @@ class CortexPlugin:
         domain: Annotated[str, "Domain to map (e.g. 'amazon.com')"],
         max_render: Annotated[int, "Max pages to render with browser"] = 50,
     ) -> Annotated[str, "JSON summary of the mapped site"]:
-        sm = cortex_client.map(domain, max_render=max_render)
-        return json.dumps(
+        key = _site_key(domain)
+        sm = cortex_client.map(key, max_render=max_render)
+        with self._locked_entry(key) as entry:
+            old, entry.site = entry.site, sm
+        if old is not None:
+            old.close()
+        return json_dumps(
             {
                 "domain": sm.domain,
                 "node_count": sm.node_count,
@@ -61,11 +133,9 @@ class CortexPlugin:
         page_type: Annotated[Optional[int], "Page type code filter"] = None,
         limit: Annotated[int, "Maximum results"] = 20,
     ) -> Annotated[str, "JSON array of matching pages"]:
-        sm = cortex_client.map(domain, max_render=5)
-        results = sm.filter(page_type=page_type, limit=limit)
-        return json.dumps(
-            [{"index": m.index, "url": m.url, "page_type": m.page_type} for m in results]
-        )
+        with self._use_site(domain) as sm:
+            batch = sm.filter_arrays(page_type=page_type, limit=limit)
+        return batch.summary_json()
 
     @kernel_function(
         description="Find shortest path between two pages on a mapped site.",
@@ -77,11 +147,11 @@ class CortexPlugin:
         from_node: Annotated[int, "Source node index"],
         to_node: Annotated[int, "Target node index"],
     ) -> Annotated[str, "JSON path result"]:
-        sm = cortex_client.map(domain, max_render=5)
-        path = sm.pathfind(from_node, to_node)
+        with self._use_site(domain) as sm:
+            path = sm.pathfind(from_node, to_node)
         if path is None:
-            return json.dumps({"path": None})
-        return json.dumps(
+            return json_dumps({"path": None})
+        return json_dumps(
             {"nodes": path.nodes, "hops": path.hops, "total_weight": path.total_weight}
         )
 
@@ -96,8 +166,31 @@ class CortexPlugin:
         opcode: Annotated[str, "Action opcode as JSON array [category, action]"],
         params: Annotated[str, "Action params as JSON object"] = "{}",
     ) -> Annotated[str, "JSON result of the action"]:
-        op = json.loads(opcode)
-        p = json.loads(params)
-        sm = cortex_client.map(domain, max_render=5)
-        result = sm.act(node, tuple(op), **p)
-        return json.dumps({"success": result.success, "new_url": result.new_url})
+        op = _parse_opcode(opcode)
+        try:
+            p = json_loads(params)
+        except ValueError:  # orjson.JSONDecodeError subclasses ValueError
+            p = None
+        if op is None or not isinstance(p, dict):
+            return json_dumps({"success": False, "error": "bad_json"})
+        with self._use_site(domain) as sm:
+            result = sm.act(node, op, params=p)
+        return json_dumps({"success": result.success, "new_url": result.new_url})
+
+    @kernel_function(
+        description="Forget a mapped site so the next call maps it again.",
+        name="cortex_invalidate",
+    )
+    def invalidate(
+        self,
+        domain: Annotated[str, "Domain whose map should be discarded"],
+    ) -> Annotated[str, "JSON confirmation"]:
+        with self._lock:
+            entry = self._sites.pop(_site_key(domain), None)
+        removed = False
+        if entry is not None:
+            with entry.lock:
+                if entry.site is not None:
+                    entry.site.close()
+                    removed = True
+        return json_dumps({"domain": domain, "invalidated": removed})
@@ -0,0 +1,77 @@
+# Copyright 2026 Cortex Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Unit tests for the CortexPlugin SiteMap cache (no runtime required)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+import cortex_client
+from cortex_semantic_kernel import CortexPlugin
+
+
+class FakeSite:
+    """SiteMap stand-in that fails if two calls use it at once."""
+
+    def __init__(self, domain: str) -> None:
+        self.domain = domain
+        self.node_count = 1
+        self.edge_count = 0
+        self.closed = False
+        self.overlapped = False
+        self._busy = threading.Lock()
+
+    def filter_arrays(self, **kwargs: Any) -> Any:
+        if not self._busy.acquire(blocking=False):
+            self.overlapped = True
+            return self
+        time.sleep(0.01)
+        self._busy.release()
+        return self
+
+    def summary_json(self) -> str:
+        return "[]"
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def mapped(monkeypatch: pytest.MonkeyPatch) -> list[FakeSite]:
+    sites: list[FakeSite] = []
+
+    def fake_map(domain: str, **kwargs: Any) -> FakeSite:
+        time.sleep(0.02)
+        sites.append(FakeSite(domain))
+        return sites[-1]
+
+    monkeypatch.setattr(cortex_client, "map", fake_map)
+    return sites
+
+
+def test_concurrent_calls_share_one_map(mapped: list[FakeSite]) -> None:
+    plugin = CortexPlugin()
+    domains = ["Example.com", "https://example.com/x/", "example.com"] * 3
+    threads = [
+        threading.Thread(target=plugin.query_site, args=(d,)) for d in domains
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert [s.domain for s in mapped] == ["example.com"]
+    assert not mapped[0].overlapped
+
+
+def test_replaced_and_invalidated_maps_are_closed(mapped: list[FakeSite]) -> None:
+    plugin = CortexPlugin()
+    plugin.query_site("example.com")
+    plugin.map_site("Example.com")
+    assert mapped[0].closed
+    assert '"invalidated":true' in plugin.invalidate("example.com/")
+    assert mapped[1].closed
+    assert '"invalidated":false' in plugin.invalidate("example.com")